@@ -0,0 +1,93 @@
+"""Event capture for replaying Template climate workloads."""
+
+import logging
+import time
+from typing import Any
+
+from homeassistant.const import EVENT_HOMEASSISTANT_FINAL_WRITE
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.event import async_call_later
+from homeassistant.helpers.json import json_dumps
+from homeassistant.util.ulid import ulid_now
+
+_LOGGER = logging.getLogger(__name__)
+
+DATA_CAPTURES = "climate_template_captures"
+
+CAPTURE_INPUT = "input"
+CAPTURE_WRITE = "write"
+CAPTURE_ACTION = "action"
+
+FLUSH_DELAY = 5
+
+
+class CaptureWriter:
+    """Buffer capture records and append them to a JSONL file."""
+
+    def __init__(self, hass: HomeAssistant, path: str) -> None:
+        """Initialize the writer."""
+        self._hass = hass
+        self._path = path
+        # monotonic timestamps restart with Home Assistant, so tag each run
+        self._session = ulid_now()
+        self._buffer: list[str] = []
+        self._cancel_flush = None
+        hass.bus.async_listen_once(EVENT_HOMEASSISTANT_FINAL_WRITE, self._async_flush)
+
+    @callback
+    def async_record(
+        self,
+        entity_id: str | None,
+        kind: str,
+        name: str | None,
+        value: Any,
+        batch: int | None = None,
+    ) -> None:
+        """Record an event with its session and a monotonic timestamp."""
+        # templates often render lists, keep them so replays get the same value
+        if not isinstance(value, (str, int, float, bool, list, dict, type(None))):
+            value = str(value)
+        self._buffer.append(
+            json_dumps(
+                {
+                    "s": self._session,
+                    "t": time.monotonic(),
+                    "b": batch,
+                    "e": entity_id,
+                    "k": kind,
+                    "n": name,
+                    "v": value,
+                }
+            )
+        )
+        if self._cancel_flush is None:
+            self._cancel_flush = async_call_later(
+                self._hass, FLUSH_DELAY, self._async_flush
+            )
+
+    @callback
+    def _async_flush(self, _now=None) -> None:
+        if self._cancel_flush is not None:
+            self._cancel_flush()
+            self._cancel_flush = None
+        if not self._buffer:
+            return
+        lines, self._buffer = self._buffer, []
+        self._hass.async_add_executor_job(self._write, lines)
+
+    def _write(self, lines: list[str]) -> None:
+        try:
+            with open(self._path, "a", encoding="utf-8") as file:
+                file.write("\n".join(lines) + "\n")
+        except OSError as err:
+            _LOGGER.error("Could not write capture to %s: %s", self._path, err)
+
+
+@callback
+def async_get_capture_writer(hass: HomeAssistant, path: str) -> CaptureWriter:
+    """Return the shared writer for a capture file, creating it if needed."""
+    writers: dict[str, CaptureWriter] = hass.data.setdefault(DATA_CAPTURES, {})
+    path = hass.config.path(path)
+    if (writer := writers.get(path)) is None:
+        writer = writers[path] = CaptureWriter(hass, path)
+    return writer
@@ -1,6 +1,10 @@
 """Support for Template climates."""
 
+from datetime import timedelta
+from functools import wraps
+from inspect import unwrap
 import logging
+import zlib
 
 import homeassistant.helpers.config_validation as cv
 import voluptuous as vol
@@ -16,6 +20,7 @@ from homeassistant.components.climate.const import (
     ATTR_MIN_TEMP,
     ATTR_MAX_TEMP,
     ATTR_HVAC_MODE,
+    ATTR_HVAC_ACTION,
     ATTR_FAN_MODE,
     ATTR_PRESET_MODE,
     ATTR_SWING_MODE,
@@ -50,17 +55,30 @@ from homeassistant.const import (
     PRECISION_TENTHS,
     PRECISION_WHOLE,
     ATTR_TEMPERATURE,
-    STATE_UNKNOWN,
-    STATE_UNAVAILABLE,
     CONF_ICON_TEMPLATE,
     CONF_ENTITY_PICTURE_TEMPLATE,
 )
-from homeassistant.core import HomeAssistant, callback
+from homeassistant.core import Context, HomeAssistant, callback
+from homeassistant.helpers.event import async_call_later
 from homeassistant.helpers.reload import async_setup_reload_service
 from homeassistant.helpers.restore_state import RestoreEntity
 from homeassistant.helpers.script import Script
+from homeassistant.helpers.template import Template
 from homeassistant.helpers.typing import ConfigType
 
+from .capture import (
+    CAPTURE_ACTION,
+    CAPTURE_INPUT,
+    CAPTURE_WRITE,
+    CaptureWriter,
+    async_get_capture_writer,
+)
+from .command_queue import CommandQueue, async_get_command_queue
+from .group import ZoneAggregator, async_get_climate
+from .parsing import ParseErrors, is_unparsed
+from .store import TemplateResultStore, async_get_result_store
+from .tracking import CommandTracker
+
 _LOGGER = logging.getLogger(__name__)
 
 CONF_FAN_MODE_LIST = "fan_modes"
@@ -95,11 +113,45 @@ CONF_SET_FAN_MODE_ACTION = "set_fan_mode"
 CONF_SET_PRESET_MODE_ACTION = "set_preset_mode"
 CONF_SET_SWING_MODE_ACTION = "set_swing_mode"
 
+CONF_CONFIRMATION_TIMEOUT = "confirmation_timeout"
+CONF_CONFIRMATION_RETRIES = "confirmation_retries"
+CONF_COMMAND_GROUP = "command_group"
+CONF_COMMAND_SPACING = "command_spacing"
+CONF_CAPTURE_FILE = "capture_file"
+CONF_PERSIST_TEMPLATE_RESULTS = "persist_template_results"
+CONF_WARM_UP = "warm_up"
+CONF_ZONES = "zones"
+
 CONF_CLIMATES = "climates"
 
+ATTR_COMMAND_LATENCY = "command_latency"
+ATTR_COMMAND_QUEUE = "command_queue"
+ATTR_PARSE_ERRORS = "parse_errors"
+ATTR_ZONES = "zones"
+ATTR_ZONE_HVAC_ACTIONS = "zone_hvac_actions"
+
 DEFAULT_NAME = "Template Climate"
 DEFAULT_TEMP = 21
 DEFAULT_PRECISION = 1.0
+DEFAULT_MODE_LIST = [
+    HVACMode.AUTO,
+    HVACMode.OFF,
+    HVACMode.COOL,
+    HVACMode.HEAT,
+    HVACMode.DRY,
+    HVACMode.FAN_ONLY,
+]
+DEFAULT_FAN_MODE_LIST = [FAN_AUTO, FAN_LOW, FAN_MEDIUM, FAN_HIGH]
+DEFAULT_PRESET_MODE_LIST = [
+    PRESET_ECO,
+    PRESET_AWAY,
+    PRESET_BOOST,
+    PRESET_COMFORT,
+    PRESET_HOME,
+    PRESET_SLEEP,
+    PRESET_ACTIVITY,
+]
+DEFAULT_SWING_MODE_LIST = [STATE_ON, HVACMode.OFF]
 DOMAIN = "climate_template"
 PLATFORMS = ["climate"]
 
@@ -129,35 +181,13 @@ PLATFORM_SCHEMA = cv.PLATFORM_SCHEMA.extend(
         vol.Optional(CONF_SET_FAN_MODE_ACTION): cv.SCRIPT_SCHEMA,
         vol.Optional(CONF_SET_PRESET_MODE_ACTION): cv.SCRIPT_SCHEMA,
         vol.Optional(CONF_SET_SWING_MODE_ACTION): cv.SCRIPT_SCHEMA,
+        vol.Optional(CONF_MODE_LIST, default=DEFAULT_MODE_LIST): cv.ensure_list,
+        vol.Optional(CONF_FAN_MODE_LIST, default=DEFAULT_FAN_MODE_LIST): cv.ensure_list,
         vol.Optional(
-            CONF_MODE_LIST,
-            default=[
-                HVACMode.AUTO,
-                HVACMode.OFF,
-                HVACMode.COOL,
-                HVACMode.HEAT,
-                HVACMode.DRY,
-                HVACMode.FAN_ONLY,
-            ],
-        ): cv.ensure_list,
-        vol.Optional(
-            CONF_FAN_MODE_LIST,
-            default=[FAN_AUTO, FAN_LOW, FAN_MEDIUM, FAN_HIGH],
-        ): cv.ensure_list,
-        vol.Optional(
-            CONF_PRESET_MODE_LIST,
-            default=[
-                PRESET_ECO,
-                PRESET_AWAY,
-                PRESET_BOOST,
-                PRESET_COMFORT,
-                PRESET_HOME,
-                PRESET_SLEEP,
-                PRESET_ACTIVITY,
-            ],
+            CONF_PRESET_MODE_LIST, default=DEFAULT_PRESET_MODE_LIST
         ): cv.ensure_list,
         vol.Optional(
-            CONF_SWING_MODE_LIST, default=[STATE_ON, HVACMode.OFF]
+            CONF_SWING_MODE_LIST, default=DEFAULT_SWING_MODE_LIST
         ): cv.ensure_list,
         vol.Optional(CONF_TEMP_MIN_TEMPLATE): cv.template,
         vol.Optional(CONF_TEMP_MIN, default=DEFAULT_MIN_TEMP): vol.Coerce(float),
@@ -167,9 +197,123 @@ PLATFORM_SCHEMA = cv.PLATFORM_SCHEMA.extend(
             [PRECISION_TENTHS, PRECISION_HALVES, PRECISION_WHOLE]
         ),
         vol.Optional(CONF_TEMP_STEP, default=DEFAULT_PRECISION): vol.Coerce(float),
+        vol.Optional(CONF_CONFIRMATION_TIMEOUT): cv.positive_time_period,
+        vol.Optional(CONF_CONFIRMATION_RETRIES, default=0): cv.positive_int,
+        vol.Optional(CONF_COMMAND_GROUP): cv.string,
+        vol.Optional(CONF_COMMAND_SPACING, default=0): cv.positive_time_period,
+        vol.Optional(CONF_CAPTURE_FILE): cv.string,
+        vol.Optional(CONF_PERSIST_TEMPLATE_RESULTS, default=False): cv.boolean,
+        vol.Optional(CONF_WARM_UP, default=0): cv.positive_time_period,
+        vol.Optional(CONF_ZONES): cv.entity_ids,
     }
 )
 
+# config key, template property, parsed attribute and update handler of each template
+TEMPLATE_ATTRIBUTES = (
+    (
+        CONF_TEMP_MIN_TEMPLATE,
+        "_min_temp_template",
+        "_attr_min_temp",
+        "_update_min_temp",
+    ),
+    (
+        CONF_TEMP_MAX_TEMPLATE,
+        "_max_temp_template",
+        "_attr_max_temp",
+        "_update_max_temp",
+    ),
+    (
+        CONF_CURRENT_TEMP_TEMPLATE,
+        "_current_temp_template",
+        "_attr_current_temperature",
+        "_update_current_temp",
+    ),
+    (
+        CONF_CURRENT_HUMIDITY_TEMPLATE,
+        "_current_humidity_template",
+        "_attr_current_humidity",
+        "_update_current_humidity",
+    ),
+    (
+        CONF_MIN_HUMIDITY_TEMPLATE,
+        "_min_humidity_template",
+        "_attr_min_humidity",
+        "_update_min_humidity",
+    ),
+    (
+        CONF_MAX_HUMIDITY_TEMPLATE,
+        "_max_humidity_template",
+        "_attr_max_humidity",
+        "_update_max_humidity",
+    ),
+    (
+        CONF_TARGET_HUMIDITY_TEMPLATE,
+        "_target_humidity_template",
+        "_attr_target_humidity",
+        "_update_target_humidity",
+    ),
+    (
+        CONF_TARGET_TEMPERATURE_TEMPLATE,
+        "_target_temperature_template",
+        "_attr_target_temperature",
+        "_update_target_temp",
+    ),
+    (
+        CONF_TARGET_TEMPERATURE_HIGH_TEMPLATE,
+        "_target_temperature_high_template",
+        "_attr_target_temperature_high",
+        "_update_target_temp_high",
+    ),
+    (
+        CONF_TARGET_TEMPERATURE_LOW_TEMPLATE,
+        "_target_temperature_low_template",
+        "_attr_target_temperature_low",
+        "_update_target_temp_low",
+    ),
+    (
+        CONF_HVAC_MODE_TEMPLATE,
+        "_hvac_mode_template",
+        "_attr_hvac_mode",
+        "_update_hvac_mode",
+    ),
+    (
+        CONF_PRESET_MODE_TEMPLATE,
+        "_preset_mode_template",
+        "_attr_preset_mode",
+        "_update_preset_mode",
+    ),
+    (
+        CONF_FAN_MODE_TEMPLATE,
+        "_fan_mode_template",
+        "_attr_fan_mode",
+        "_update_fan_mode",
+    ),
+    (
+        CONF_SWING_MODE_TEMPLATE,
+        "_swing_mode_template",
+        "_attr_swing_mode",
+        "_update_swing_mode",
+    ),
+    (
+        CONF_HVAC_ACTION_TEMPLATE,
+        "_hvac_action_template",
+        "_attr_hvac_action",
+        "_update_hvac_action",
+    ),
+)
+
+# hvac action results are linked to an attribute of their own, so a template
+# error leaves the last hvac action in place instead of clearing it
+LINKED_ATTRIBUTES = {"_attr_hvac_action": "_hvac_action"}
+
+# climates configured with equal mode lists share a single list
+_SHARED_LISTS: dict[tuple, list] = {}
+
+
+def _shared_list(values: list) -> list:
+    """Return a list equal to values that is shared by all climates using it."""
+    return _SHARED_LISTS.setdefault(tuple(values), values)
+
 
 async def async_setup_platform(
     hass: HomeAssistant, config: ConfigType, async_add_entities, discovery_info=None
@@ -194,6 +338,53 @@ class TemplateClimate(TemplateEntity, ClimateEntity, RestoreEntity):
     _attr_should_poll = False
     _entity_id_format = ENTITY_ID_FORMAT
     _enable_turn_on_off_backwards_compatibility = False
+    # counters change far more often than the climate itself
+    _unrecorded_attributes = frozenset(
+        {ATTR_PARSE_ERRORS, ATTR_COMMAND_LATENCY, ATTR_COMMAND_QUEUE}
+    )
+
+    # optimistic defaults, kept on the class so unset values cost no memory
+    _attr_fan_mode = FAN_LOW
+    _attr_preset_mode = PRESET_COMFORT
+    _attr_hvac_mode = HVACMode.OFF
+    _attr_swing_mode = HVACMode.OFF
+    _attr_target_temperature = DEFAULT_TEMP
+    _attr_target_temperature_high = None
+    _attr_target_temperature_low = None
+
+    # only set on an instance when configured
+    _min_temp_template: Template | None = None
+    _max_temp_template: Template | None = None
+    _current_temp_template: Template | None = None
+    _current_humidity_template: Template | None = None
+    _min_humidity_template: Template | None = None
+    _max_humidity_template: Template | None = None
+    _target_humidity_template: Template | None = None
+    _target_temperature_template: Template | None = None
+    _target_temperature_high_template: Template | None = None
+    _target_temperature_low_template: Template | None = None
+    _hvac_mode_template: Template | None = None
+    _fan_mode_template: Template | None = None
+    _preset_mode_template: Template | None = None
+    _swing_mode_template: Template | None = None
+    _hvac_action_template: Template | None = None
+    _set_humidity_script: Script | None = None
+    _set_hvac_mode_script: Script | None = None
+    _set_swing_mode_script: Script | None = None
+    _set_fan_mode_script: Script | None = None
+    _set_preset_mode_script: Script | None = None
+    _set_temperature_script: Script | None = None
+    _command_tracker: CommandTracker | None = None
+    _command_queue: CommandQueue | None = None
+    _command_spacing: timedelta | None = None
+    _parse_errors: ParseErrors | None = None
+    _capture: CaptureWriter | None = None
+    _capture_batch = 0
+    _result_store: TemplateResultStore | None = None
+    _persist_template_results = False
+    _template_result_attrs: tuple[str, ...] = ()
+    _warm_up = 0.0
+    _zone_aggregator: ZoneAggregator | None = None
 
     def __init__(self, hass: HomeAssistant, config: ConfigType, unique_id: str | None):
         """Initialize the climate device."""
@@ -204,42 +395,18 @@ class TemplateClimate(TemplateEntity, ClimateEntity, RestoreEntity):
         self._attr_max_temp = config[CONF_TEMP_MAX]
         self._attr_target_temperature_step = config[CONF_TEMP_STEP]
         self._attr_temperature_unit = hass.config.units.temperature_unit
-        self._attr_hvac_modes = config[CONF_MODE_LIST]
-        self._attr_fan_modes = config[CONF_FAN_MODE_LIST]
-        self._attr_preset_modes = config[CONF_PRESET_MODE_LIST]
-        self._attr_swing_modes = config[CONF_SWING_MODE_LIST]
-        # set optimistic default attrs
-        self._attr_fan_mode = FAN_LOW
-        self._attr_preset_mode = PRESET_COMFORT
-        self._attr_hvac_mode = HVACMode.OFF
-        self._attr_swing_mode = HVACMode.OFF
-        self._attr_target_temperature = DEFAULT_TEMP
-        self._attr_target_temperature_high = None
-        self._attr_target_temperature_low = None
+        self._attr_hvac_modes = _shared_list(config[CONF_MODE_LIST])
+        self._attr_fan_modes = _shared_list(config[CONF_FAN_MODE_LIST])
+        self._attr_preset_modes = _shared_list(config[CONF_PRESET_MODE_LIST])
+        self._attr_swing_modes = _shared_list(config[CONF_SWING_MODE_LIST])
 
         if (precision := config.get(CONF_PRECISION)) is not None:
             self._attr_precision = precision
 
         # set template properties
-        self._min_temp_template = config.get(CONF_TEMP_MIN_TEMPLATE)
-        self._max_temp_template = config.get(CONF_TEMP_MAX_TEMPLATE)
-        self._current_temp_template = config.get(CONF_CURRENT_TEMP_TEMPLATE)
-        self._current_humidity_template = config.get(CONF_CURRENT_HUMIDITY_TEMPLATE)
-        self._min_humidity_template = config.get(CONF_MIN_HUMIDITY_TEMPLATE)
-        self._max_humidity_template = config.get(CONF_MAX_HUMIDITY_TEMPLATE)
-        self._target_humidity_template = config.get(CONF_TARGET_HUMIDITY_TEMPLATE)
-        self._target_temperature_template = config.get(CONF_TARGET_TEMPERATURE_TEMPLATE)
-        self._target_temperature_high_template = config.get(
-            CONF_TARGET_TEMPERATURE_HIGH_TEMPLATE
-        )
-        self._target_temperature_low_template = config.get(
-            CONF_TARGET_TEMPERATURE_LOW_TEMPLATE
-        )
-        self._hvac_mode_template = config.get(CONF_HVAC_MODE_TEMPLATE)
-        self._fan_mode_template = config.get(CONF_FAN_MODE_TEMPLATE)
-        self._preset_mode_template = config.get(CONF_PRESET_MODE_TEMPLATE)
-        self._swing_mode_template = config.get(CONF_SWING_MODE_TEMPLATE)
-        self._hvac_action_template = config.get(CONF_HVAC_ACTION_TEMPLATE)
+        for conf, template_attr, _, _ in TEMPLATE_ATTRIBUTES:
+            if (template := config.get(conf)) is not None:
+                setattr(self, template_attr, template)
 
         # set turn on/off features
         if len(self._attr_hvac_modes) >= 2:
@@ -250,41 +417,35 @@ class TemplateClimate(TemplateEntity, ClimateEntity, RestoreEntity):
             self._attr_supported_features |= ClimateEntityFeature.TURN_OFF
 
         # set script variables
-        self._set_humidity_script = None
         if set_humidity_action := config.get(CONF_SET_HUMIDITY_ACTION):
             self._set_humidity_script = Script(
                 hass, set_humidity_action, self._attr_name, DOMAIN
             )
             self._attr_supported_features |= ClimateEntityFeature.TARGET_HUMIDITY
 
-        self._set_hvac_mode_script = None
         if set_hvac_mode_action := config.get(CONF_SET_HVAC_MODE_ACTION):
             self._set_hvac_mode_script = Script(
                 hass, set_hvac_mode_action, self._attr_name, DOMAIN
             )
 
-        self._set_swing_mode_script = None
         if set_swing_mode_action := config.get(CONF_SET_SWING_MODE_ACTION):
             self._set_swing_mode_script = Script(
                 hass, set_swing_mode_action, self._attr_name, DOMAIN
             )
             self._attr_supported_features |= ClimateEntityFeature.SWING_MODE
 
-        self._set_fan_mode_script = None
         if set_fan_mode_action := config.get(CONF_SET_FAN_MODE_ACTION):
             self._set_fan_mode_script = Script(
                 hass, set_fan_mode_action, self._attr_name, DOMAIN
             )
             self._attr_supported_features |= ClimateEntityFeature.FAN_MODE
 
-        self._set_preset_mode_script = None
         if set_preset_mode_action := config.get(CONF_SET_PRESET_MODE_ACTION):
             self._set_preset_mode_script = Script(
                 hass, set_preset_mode_action, self._attr_name, DOMAIN
             )
             self._attr_supported_features |= ClimateEntityFeature.PRESET_MODE
 
-        self._set_temperature_script = None
         if set_temperature_action := config.get(CONF_SET_TEMPERATURE_ACTION):
             self._set_temperature_script = Script(
                 hass, set_temperature_action, self._attr_name, DOMAIN
@@ -307,10 +468,59 @@ class TemplateClimate(TemplateEntity, ClimateEntity, RestoreEntity):
             else:
                 self._attr_supported_features |= ClimateEntityFeature.TARGET_TEMPERATURE
 
+        # set command confirmation tracking
+        if (timeout := config.get(CONF_CONFIRMATION_TIMEOUT)) is not None:
+            self._command_tracker = CommandTracker(
+                self,
+                timeout,
+                config[CONF_CONFIRMATION_RETRIES],
+                self._async_command_timed_out,
+                # a device rounding to its step reports at most half a step off
+                max(self.precision, self._attr_target_temperature_step) / 2,
+            )
+
+        # set shared command queue
+        if (command_group := config.get(CONF_COMMAND_GROUP)) is not None:
+            self._command_queue = async_get_command_queue(hass, command_group)
+            self._command_spacing = config[CONF_COMMAND_SPACING]
+
+        # set event capture
+        if (capture_file := config.get(CONF_CAPTURE_FILE)) is not None:
+            self._capture = async_get_capture_writer(hass, capture_file)
+
+        # set template result persistence
+        if config[CONF_PERSIST_TEMPLATE_RESULTS]:
+            self._persist_template_results = True
+            self._template_result_attrs = tuple(
+                attribute
+                for conf, _, attribute, _ in TEMPLATE_ATTRIBUTES
+                if conf in config
+            )
+        if warm_up := config[CONF_WARM_UP].total_seconds():
+            self._warm_up = warm_up
+
+        # set zone aggregation for groups
+        if zones := config.get(CONF_ZONES):
+            self._zone_aggregator = ZoneAggregator(
+                hass, zones, self._async_zones_updated
+            )
+
     async def async_added_to_hass(self):
         """Run when entity about to be added."""
+        if self._persist_template_results and self._template_result_attrs:
+            # load before the templates are set up, their handlers store results
+            self._result_store = await async_get_result_store(self.hass)
+
         await super().async_added_to_hass()
 
+        if self._command_tracker:
+            self.async_on_remove(self._command_tracker.async_cancel_all)
+
+        if self._command_queue:
+            self.async_on_remove(
+                self._command_queue.async_register(self._command_spacing)
+            )
+
         # Check If we have an old state
         previous_state = await self.async_get_last_state()
         if previous_state is not None:
@@ -359,252 +569,258 @@ class TemplateClimate(TemplateEntity, ClimateEntity, RestoreEntity):
             if humidity := previous_state.attributes.get(ATTR_HUMIDITY):
                 self._attr_target_humidity = humidity
 
-    @callback
-    def _async_setup_templates(self) -> None:
-        """Set up templates."""
-        if self._min_temp_template:
-            self.add_template_attribute(
-                "_attr_min_temp",
-                self._min_temp_template,
-                None,
-                self._update_min_temp,
-                none_on_template_error=True,
-            )
+        if self._result_store:
+            self._result_store.async_claim(self._result_key)
+            # only restore if the templates have not rendered yet
+            if self._template_result_info is None and (
+                results := self._result_store.async_get(self._result_key)
+            ):
+                self._restore_template_results(results)
 
-        if self._max_temp_template:
-            self.add_template_attribute(
-                "_attr_max_temp",
-                self._max_temp_template,
-                None,
-                self._update_max_temp,
-                none_on_template_error=True,
-            )
+        if self._zone_aggregator:
+            self.async_on_remove(self._zone_aggregator.async_start())
 
-        if self._current_temp_template:
-            self.add_template_attribute(
-                "_attr_current_temperature",
-                self._current_temp_template,
-                None,
-                self._update_current_temp,
-                none_on_template_error=True,
-            )
+    @property
+    def _result_key(self) -> str:
+        """Return the key of the climate's stored template results."""
+        return self.unique_id or self.entity_id
+
+    def _restore_template_results(self, results: dict) -> None:
+        """Restore the last parsed template results."""
+        # the configured modes may have changed since the results were stored
+        allowed = {
+            "_attr_hvac_mode": self._attr_hvac_modes,
+            "_attr_fan_mode": self._attr_fan_modes,
+            "_attr_preset_mode": self._attr_preset_modes,
+            "_attr_swing_mode": self._attr_swing_modes,
+        }
+        for attribute in self._template_result_attrs:
+            if attribute not in results:
+                continue
+            value = results[attribute]
+            if attribute in allowed and value not in allowed[attribute]:
+                continue
+            if attribute == "_attr_hvac_mode":
+                value = HVACMode(value)
+            elif attribute == "_attr_hvac_action":
+                if value is not None and value not in HVACAction:
+                    continue
+            setattr(self, attribute, value)
 
-        if self._current_humidity_template:
-            self.add_template_attribute(
-                "_attr_current_humidity",
-                self._current_humidity_template,
-                None,
-                self._update_current_humidity,
-                none_on_template_error=True,
-            )
+    @callback
+    def _async_template_startup(self, _hass, log_fn=None) -> None:
+        """Start rendering templates, spread over the warm-up window."""
+        startup = super()._async_template_startup
+        if not self._warm_up or log_fn is not None:
+            startup(_hass, log_fn)
+            return
+
+        # spread entities evenly but deterministically over the window
+        delay = self._warm_up * zlib.crc32(self.entity_id.encode()) / 0xFFFFFFFF
+
+        @callback
+        def _async_startup(_now) -> None:
+            startup(_hass)
+
+        self.async_on_remove(async_call_later(self.hass, delay, _async_startup))
+
+    def add_template_attribute(
+        self,
+        attribute,
+        template,
+        validator=None,
+        on_update=None,
+        none_on_template_error=False,
+    ) -> None:
+        """Link a template to an attribute, capturing its results if enabled."""
+        if self._capture and getattr(unwrap(on_update), "__self__", None) is self:
+            on_update = self._capture_input(on_update)
+        super().add_template_attribute(
+            attribute, template, validator, on_update, none_on_template_error
+        )
 
-        if self._min_humidity_template:
-            self.add_template_attribute(
-                "_attr_min_humidity",
-                self._min_humidity_template,
-                None,
-                self._update_min_humidity,
-                none_on_template_error=True,
-            )
+    def _capture_input(self, on_update):
+        """Wrap a template update handler to record its inputs."""
+        name = on_update.__name__
 
-        if self._max_humidity_template:
-            self.add_template_attribute(
-                "_attr_max_humidity",
-                self._max_humidity_template,
-                None,
-                self._update_max_humidity,
-                none_on_template_error=True,
+        @callback
+        def _update(result) -> None:
+            self._capture.async_record(
+                self.entity_id, CAPTURE_INPUT, name, result, self._capture_batch
             )
+            on_update(result)
 
-        if self._target_humidity_template:
-            self.add_template_attribute(
-                "_attr_target_humidity",
-                self._target_humidity_template,
-                None,
-                self._update_target_humidity,
-                none_on_template_error=True,
-            )
+        return _update
 
-        if self._target_temperature_template:
-            self.add_template_attribute(
-                "_attr_target_temperature",
-                self._target_temperature_template,
-                None,
-                self._update_target_temp,
-                none_on_template_error=True,
+    @callback
+    def _handle_results(self, event, updates) -> None:
+        """Handle a batch of template results, numbering it when capturing."""
+        if self._capture:
+            self._capture_batch += 1
+        super()._handle_results(event, updates)
+
+    def _store_results(self, on_update, attribute: str):
+        """Wrap a template update handler to store the value it parses."""
+
+        @callback
+        @wraps(on_update)
+        def _update(result) -> None:
+            on_update(result)
+            self._result_store.async_update(
+                self._result_key, attribute, getattr(self, attribute)
             )
 
-        if self._target_temperature_high_template:
-            self.add_template_attribute(
-                "_attr_target_temperature_high",
-                self._target_temperature_high_template,
-                None,
-                self._update_target_temp_high,
-                none_on_template_error=True,
-            )
+        return _update
 
-        if self._target_temperature_low_template:
-            self.add_template_attribute(
-                "_attr_target_temperature_low",
-                self._target_temperature_low_template,
-                None,
-                self._update_target_temp_low,
-                none_on_template_error=True,
-            )
+    @callback
+    def async_write_ha_state(self) -> None:
+        """Write the state to the state machine."""
+        if self._capture:
+            self._capture.async_record(self.entity_id, CAPTURE_WRITE, None, self.state)
+        super().async_write_ha_state()
 
-        if self._hvac_mode_template:
-            self.add_template_attribute(
-                "_attr_hvac_mode",
-                self._hvac_mode_template,
-                None,
-                self._update_hvac_mode,
-                none_on_template_error=True,
-            )
-        if self._preset_mode_template:
+    @callback
+    def _async_setup_templates(self) -> None:
+        """Set up templates."""
+        for _, template_attr, attribute, handler in TEMPLATE_ATTRIBUTES:
+            if (template := getattr(self, template_attr)) is None:
+                continue
+            on_update = getattr(self, handler)
+            if self._result_store:
+                on_update = self._store_results(on_update, attribute)
             self.add_template_attribute(
-                "_attr_preset_mode",
-                self._preset_mode_template,
+                LINKED_ATTRIBUTES.get(attribute, attribute),
+                template,
                 None,
-                self._update_preset_mode,
+                on_update,
                 none_on_template_error=True,
             )
+        super()._async_setup_templates()
 
-        if self._fan_mode_template:
-            self.add_template_attribute(
-                "_attr_fan_mode",
-                self._fan_mode_template,
-                None,
-                self._update_fan_mode,
-                none_on_template_error=True,
+    def _parse_number(self, attribute: str, value, cast=float):
+        """Return a numeric template result, None if it has no usable value."""
+        # templates usually render numbers as native ints and floats already
+        if type(value) is cast:
+            return value
+        try:
+            return cast(value)
+        except (TypeError, ValueError):
+            # only look for unknown and unavailable once the cast failed
+            if value is None or is_unparsed(value):
+                return None
+            self._async_parse_error(
+                attribute, "Could not parse %s from %s", attribute, value
             )
+            return None
 
-        if self._swing_mode_template:
-            self.add_template_attribute(
-                "_attr_swing_mode",
-                self._swing_mode_template,
-                None,
-                self._update_swing_mode,
-                none_on_template_error=True,
+    @callback
+    def _async_parse_error(self, attribute: str, message: str, *args) -> None:
+        """Count and log a template result that could not be used."""
+        if self._parse_errors is None:
+            self._parse_errors = ParseErrors(
+                self.hass, self.entity_id, self._async_parse_errors_reported
             )
+            self.async_on_remove(self._parse_errors.async_cancel)
+        self._parse_errors.record(attribute, message, *args)
 
-        if self._hvac_action_template:
-            self.add_template_attribute(
-                "_hvac_action",
-                self._hvac_action_template,
-                None,
-                self._update_hvac_action,
-                none_on_template_error=True,
-            )
-        super()._async_setup_templates()
+    @callback
+    def _async_parse_errors_reported(self) -> None:
+        """Publish the parse error counts when they are logged."""
+        self._attr_extra_state_attributes[ATTR_PARSE_ERRORS] = (
+            self._parse_errors.as_dict()
+        )
+        self.async_write_ha_state()
 
     @callback
     def _update_min_temp(self, temp):
-        if temp not in (STATE_UNKNOWN, STATE_UNAVAILABLE):
-            try:
-                self._attr_min_temp = float(temp)
-            except ValueError:
-                _LOGGER.error("Could not parse min temperature from %s", temp)
+        if (temp := self._parse_number(ATTR_MIN_TEMP, temp)) is not None:
+            self._attr_min_temp = temp
 
     @callback
     def _update_max_temp(self, temp):
-        if temp not in (STATE_UNKNOWN, STATE_UNAVAILABLE):
-            try:
-                self._attr_max_temp = float(temp)
-            except ValueError:
-                _LOGGER.error("Could not parse max temperature from %s", temp)
+        if (temp := self._parse_number(ATTR_MAX_TEMP, temp)) is not None:
+            self._attr_max_temp = temp
 
     @callback
     def _update_current_temp(self, temp):
-        if temp not in (STATE_UNKNOWN, STATE_UNAVAILABLE):
-            try:
-                self._attr_current_temperature = float(temp)
-            except ValueError:
-                _LOGGER.error("Could not parse temperature from %s", temp)
+        if (temp := self._parse_number(ATTR_CURRENT_TEMPERATURE, temp)) is not None:
+            self._attr_current_temperature = temp
 
     @callback
     def _update_current_humidity(self, humidity):
-        if humidity not in (STATE_UNKNOWN, STATE_UNAVAILABLE):
-            try:
-                self._attr_current_humidity = int(humidity)
-            except ValueError:
-                _LOGGER.error("Could not parse humidity from %s", humidity)
+        if (
+            humidity := self._parse_number(ATTR_CURRENT_HUMIDITY, humidity, int)
+        ) is not None:
+            self._attr_current_humidity = humidity
 
     @callback
     def _update_min_humidity(self, humidity):
-        if humidity not in (STATE_UNKNOWN, STATE_UNAVAILABLE):
-            try:
-                self._attr_min_humidity = float(humidity)
-            except ValueError:
-                _LOGGER.error("Could not parse min humidity from %s", humidity)
+        if (humidity := self._parse_number(ATTR_MIN_HUMIDITY, humidity)) is not None:
+            self._attr_min_humidity = humidity
 
     @callback
     def _update_max_humidity(self, humidity):
-        if humidity not in (STATE_UNKNOWN, STATE_UNAVAILABLE):
-            try:
-                self._attr_max_humidity = float(humidity)
-            except ValueError:
-                _LOGGER.error("Could not parse max humidity from %s", humidity)
+        if (humidity := self._parse_number(ATTR_MAX_HUMIDITY, humidity)) is not None:
+            self._attr_max_humidity = humidity
 
     @callback
     def _update_target_humidity(self, humidity):
-        if humidity not in (STATE_UNKNOWN, STATE_UNAVAILABLE):
-            try:
-                new_humidity = float(humidity)
-                if (
-                    new_humidity != self._attr_target_humidity
-                ):  # Only update if there's a change
-                    self._attr_target_humidity = new_humidity
-                    self.async_write_ha_state()  # Update HA state without triggering an action
-            except ValueError:
-                _LOGGER.error("Could not parse target humidity from %s", humidity)
+        if (new_humidity := self._parse_number(ATTR_HUMIDITY, humidity)) is None:
+            return
+        self._async_confirm_command(ATTR_HUMIDITY, new_humidity)
+        if (
+            new_humidity != self._attr_target_humidity
+        ):  # Only update if there's a change
+            self._attr_target_humidity = new_humidity
+            self.async_write_ha_state()  # Update HA state without triggering an action
 
     @callback
     def _update_target_temp(self, temp):
-        if temp not in (STATE_UNKNOWN, STATE_UNAVAILABLE):
-            try:
-                # Update the internal state without triggering the set_temperature action
-                new_target_temp = float(temp)
-                if (
-                    new_target_temp != self._attr_target_temperature
-                ):  # Only update if there's a change
-                    self._attr_target_temperature = new_target_temp
-                    self.async_write_ha_state()  # Update the HA state without triggering an action
-            except ValueError:
-                _LOGGER.error("Could not parse temperature from %s", temp)
+        # Update the internal state without triggering the set_temperature action
+        if (new_target_temp := self._parse_number(ATTR_TEMPERATURE, temp)) is None:
+            return
+        self._async_confirm_command(ATTR_TEMPERATURE, new_target_temp)
+        if (
+            new_target_temp != self._attr_target_temperature
+        ):  # Only update if there's a change
+            self._attr_target_temperature = new_target_temp
+            self.async_write_ha_state()  # Update the HA state without triggering an action
 
     @callback
     def _update_target_temp_high(self, temp):
-        if temp not in (STATE_UNKNOWN, STATE_UNAVAILABLE):
-            try:
-                # Update the internal state without triggering the set_temperature action
-                new_target_temp_high = float(temp)
-                if new_target_temp_high != self._attr_target_temperature_high:
-                    self._attr_target_temperature_high = new_target_temp_high
-                    self.async_write_ha_state()
-            except ValueError:
-                _LOGGER.error("Could not parse temperature high from %s", temp)
+        # Update the internal state without triggering the set_temperature action
+        if (
+            new_target_temp_high := self._parse_number(ATTR_TARGET_TEMP_HIGH, temp)
+        ) is None:
+            return
+        self._async_confirm_command(ATTR_TARGET_TEMP_HIGH, new_target_temp_high)
+        if new_target_temp_high != self._attr_target_temperature_high:
+            self._attr_target_temperature_high = new_target_temp_high
+            self.async_write_ha_state()
 
     @callback
     def _update_target_temp_low(self, temp):
-        if temp not in (STATE_UNKNOWN, STATE_UNAVAILABLE):
-            try:
-                # Update the internal state without triggering the set_temperature action
-                new_target_temp_low = float(temp)
-                if new_target_temp_low != self._attr_target_temperature_low:
-                    self._attr_target_temperature_low = new_target_temp_low
-                    self.async_write_ha_state()
-            except ValueError:
-                _LOGGER.error("Could not parse temperature low from %s", temp)
+        # Update the internal state without triggering the set_temperature action
+        if (
+            new_target_temp_low := self._parse_number(ATTR_TARGET_TEMP_LOW, temp)
+        ) is None:
+            return
+        self._async_confirm_command(ATTR_TARGET_TEMP_LOW, new_target_temp_low)
+        if new_target_temp_low != self._attr_target_temperature_low:
+            self._attr_target_temperature_low = new_target_temp_low
+            self.async_write_ha_state()
 
     @callback
     def _update_hvac_mode(self, hvac_mode):
         if hvac_mode in self._attr_hvac_modes:
             hvac_mode = HVACMode(hvac_mode) if hvac_mode else None
+            self._async_confirm_command(ATTR_HVAC_MODE, hvac_mode)
             if self._attr_hvac_mode != hvac_mode:  # Only update if there's a change
                 self._attr_hvac_mode = hvac_mode
                 self.async_write_ha_state()  # Update HA state without triggering an action
-        elif hvac_mode not in (STATE_UNKNOWN, STATE_UNAVAILABLE):
-            _LOGGER.error(
+        elif not is_unparsed(hvac_mode):
+            self._async_parse_error(
+                ATTR_HVAC_MODE,
                 "Received invalid hvac mode: %s. Expected: %s.",
                 hvac_mode,
                 self._attr_hvac_modes,
@@ -613,11 +829,13 @@ class TemplateClimate(TemplateEntity, ClimateEntity, RestoreEntity):
     @callback
     def _update_preset_mode(self, preset_mode):
         if preset_mode in self._attr_preset_modes:
+            self._async_confirm_command(ATTR_PRESET_MODE, preset_mode)
             if self._attr_preset_mode != preset_mode:  # Only update if there's a change
                 self._attr_preset_mode = preset_mode
                 self.async_write_ha_state()  # Update HA state without triggering an action
-        elif preset_mode not in (STATE_UNKNOWN, STATE_UNAVAILABLE):
-            _LOGGER.error(
+        elif not is_unparsed(preset_mode):
+            self._async_parse_error(
+                ATTR_PRESET_MODE,
                 "Received invalid preset mode %s. Expected %s.",
                 preset_mode,
                 self._attr_preset_modes,
@@ -627,11 +845,13 @@ class TemplateClimate(TemplateEntity, ClimateEntity, RestoreEntity):
     def _update_fan_mode(self, fan_mode):
         fan_mode_str = str(fan_mode)
         if fan_mode_str in self._attr_fan_modes:
+            self._async_confirm_command(ATTR_FAN_MODE, fan_mode_str)
             if self._attr_fan_mode != fan_mode_str:  # Only update if there's a change
                 self._attr_fan_mode = fan_mode_str
                 self.async_write_ha_state()  # Update HA state without triggering an action
-        elif fan_mode not in (STATE_UNKNOWN, STATE_UNAVAILABLE):
-            _LOGGER.error(
+        elif not is_unparsed(fan_mode):
+            self._async_parse_error(
+                ATTR_FAN_MODE,
                 "Received invalid fan mode: %s (str: %s). Expected: %s.",
                 fan_mode,
                 fan_mode_str,
@@ -641,11 +861,13 @@ class TemplateClimate(TemplateEntity, ClimateEntity, RestoreEntity):
     @callback
     def _update_swing_mode(self, swing_mode):
         if swing_mode in self._attr_swing_modes:
+            self._async_confirm_command(ATTR_SWING_MODE, swing_mode)
             if self._attr_swing_mode != swing_mode:  # Only update if there's a change
                 self._attr_swing_mode = swing_mode
                 self.async_write_ha_state()  # Update HA state without triggering an action
-        elif swing_mode not in (STATE_UNKNOWN, STATE_UNAVAILABLE):
-            _LOGGER.error(
+        elif not is_unparsed(swing_mode):
+            self._async_parse_error(
+                ATTR_SWING_MODE,
                 "Received invalid swing mode: %s. Expected: %s.",
                 swing_mode,
                 self._attr_swing_modes,
@@ -657,13 +879,195 @@ class TemplateClimate(TemplateEntity, ClimateEntity, RestoreEntity):
             if self._attr_hvac_action != hvac_action:  # Only update if there's a change
                 self._attr_hvac_action = hvac_action
                 self.async_write_ha_state()  # Update HA state without triggering an action
-        elif hvac_action not in (STATE_UNKNOWN, STATE_UNAVAILABLE):
-            _LOGGER.error(
+        elif not is_unparsed(hvac_action):
+            self._async_parse_error(
+                ATTR_HVAC_ACTION,
                 "Received invalid hvac action: %s. Expected: %s.",
                 hvac_action,
                 [str(member) for member in HVACAction],
             )
 
+    @callback
+    def _async_zones_updated(self) -> None:
+        """Update the group state from the aggregated zone states."""
+        if self._current_temp_template is None:
+            self._attr_current_temperature = self._zone_aggregator.current_temperature
+        if self._hvac_action_template is None:
+            self._attr_hvac_action = self._zone_aggregator.hvac_action
+        if (
+            self._hvac_mode_template is None
+            and (hvac_mode := self._zone_aggregator.hvac_mode) in self._attr_hvac_modes
+        ):
+            self._attr_hvac_mode = HVACMode(hvac_mode)
+        self._attr_extra_state_attributes[ATTR_ZONE_HVAC_ACTIONS] = (
+            self._zone_aggregator.hvac_actions
+        )
+        self.async_write_ha_state()
+
+    @callback
+    def async_apply_zone_command(self, values: dict) -> None:
+        """Accept the result of a command sent by a group this climate is in."""
+        updated = False
+        for key, template, attribute, allowed in (
+            (
+                ATTR_HVAC_MODE,
+                self._hvac_mode_template,
+                "_attr_hvac_mode",
+                self._attr_hvac_modes,
+            ),
+            (
+                ATTR_FAN_MODE,
+                self._fan_mode_template,
+                "_attr_fan_mode",
+                self._attr_fan_modes,
+            ),
+            (
+                ATTR_PRESET_MODE,
+                self._preset_mode_template,
+                "_attr_preset_mode",
+                self._attr_preset_modes,
+            ),
+            (
+                ATTR_SWING_MODE,
+                self._swing_mode_template,
+                "_attr_swing_mode",
+                self._attr_swing_modes,
+            ),
+            (
+                ATTR_HUMIDITY,
+                self._target_humidity_template,
+                "_attr_target_humidity",
+                None,
+            ),
+            (
+                ATTR_TEMPERATURE,
+                self._target_temperature_template,
+                "_attr_target_temperature",
+                None,
+            ),
+            (
+                ATTR_TARGET_TEMP_HIGH,
+                self._target_temperature_high_template,
+                "_attr_target_temperature_high",
+                None,
+            ),
+            (
+                ATTR_TARGET_TEMP_LOW,
+                self._target_temperature_low_template,
+                "_attr_target_temperature_low",
+                None,
+            ),
+        ):
+            # templates report the real state of the zone, so leave those alone
+            if template is not None or (value := values.get(key)) is None:
+                continue
+            if allowed is not None and value not in allowed:
+                continue
+            if key == ATTR_HVAC_MODE:
+                value = HVACMode(value)
+            if getattr(self, attribute) != value:
+                setattr(self, attribute, value)
+                updated = True
+
+        if updated:
+            self.async_write_ha_state()
+
+    @callback
+    def _async_confirm_command(self, key: str, value) -> None:
+        """Match a template update against pending commands."""
+        if self._command_tracker and self._command_tracker.async_confirm(key, value):
+            self._attr_extra_state_attributes[ATTR_COMMAND_LATENCY] = (
+                self._command_tracker.as_dict()
+            )
+
+    @callback
+    def _async_command_timed_out(self) -> None:
+        """Update latency stats after a command was not confirmed in time."""
+        self._attr_extra_state_attributes[ATTR_COMMAND_LATENCY] = (
+            self._command_tracker.as_dict()
+        )
+        self.async_write_ha_state()
+
+    def _expected_values(
+        self, *values: tuple[Template | None, str, object, object]
+    ) -> dict:
+        """Return the template results that would confirm a command."""
+        if self._command_tracker is None:
+            return {}
+        return {
+            key: value
+            for template, key, value, current in values
+            if template is not None and value is not None and value != current
+        }
+
+    async def _async_run_action(
+        self, action: str, script: Script, run_variables: dict, expected: dict
+    ) -> None:
+        """Run a set action, tracking its confirmation when enabled."""
+        action_variables = run_variables
+        self._async_capture_action(action, action_variables)
+        # the context of the call that sent the command, also used for resends
+        context = self._context
+
+        async def _async_run() -> None:
+            await self.async_run_script(
+                script, run_variables=run_variables, context=context
+            )
+
+        async def _async_run_tracked() -> None:
+            if expected:
+                self._command_tracker.async_track(action, expected, _async_resend)
+            await _async_run()
+
+        async def _async_resend() -> None:
+            # a resend runs the script again, so capture it like the first send
+            self._async_capture_action(action, action_variables)
+            await self._async_dispatch(action, _async_run, context)
+
+        zones = None
+        if self._zone_aggregator:
+            # send one batched command for every zone it would change
+            if not (zones := self._zone_aggregator.async_affected_zones(run_variables)):
+                return
+            run_variables = {**run_variables, ATTR_ZONES: zones}
+
+        if self._command_tracker:
+            # a newer command supersedes any retry of the previous one
+            self._command_tracker.async_cancel(action)
+        if not await self._async_dispatch(action, _async_run_tracked, context):
+            # superseded in the queue, the newer command updates the zones
+            return
+
+        for zone in zones or ():
+            # zones that are not template climates only get the command itself
+            if isinstance(
+                climate := async_get_climate(self.hass, zone), TemplateClimate
+            ):
+                climate.async_apply_zone_command(run_variables)
+
+    @callback
+    def _async_capture_action(self, action: str, run_variables: dict) -> None:
+        """Record a set action when capturing."""
+        if self._capture:
+            self._capture.async_record(
+                self.entity_id, CAPTURE_ACTION, action, run_variables
+            )
+
+    async def _async_dispatch(self, action: str, job, context: Context | None) -> bool:
+        """Run a set action directly or through the shared command queue.
+
+        Returns False if a newer command superseded it in the queue.
+        """
+        if self._command_queue is None:
+            await job()
+            return True
+
+        ran = await self._command_queue.async_run(self.entity_id, action, job, context)
+        self._attr_extra_state_attributes[ATTR_COMMAND_QUEUE] = (
+            self._command_queue.as_dict()
+        )
+        return ran
+
     @property
     def target_temperature(self):
         """Return the temperature we try to reach."""
@@ -698,10 +1102,18 @@ class TemplateClimate(TemplateEntity, ClimateEntity, RestoreEntity):
             self.async_write_ha_state()
 
         if self._set_hvac_mode_script:
-            await self.async_run_script(
+            await self._async_run_action(
+                CONF_SET_HVAC_MODE_ACTION,
                 self._set_hvac_mode_script,
-                run_variables={ATTR_HVAC_MODE: hvac_mode},
-                context=self._context,
+                {ATTR_HVAC_MODE: hvac_mode},
+                self._expected_values(
+                    (
+                        self._hvac_mode_template,
+                        ATTR_HVAC_MODE,
+                        hvac_mode,
+                        self._attr_hvac_mode,
+                    )
+                ),
             )
 
     async def async_set_preset_mode(self, preset_mode: str) -> None:
@@ -711,10 +1123,18 @@ class TemplateClimate(TemplateEntity, ClimateEntity, RestoreEntity):
             self.async_write_ha_state()
 
         if self._set_preset_mode_script:
-            await self.async_run_script(
+            await self._async_run_action(
+                CONF_SET_PRESET_MODE_ACTION,
                 self._set_preset_mode_script,
-                run_variables={ATTR_PRESET_MODE: preset_mode},
-                context=self._context,
+                {ATTR_PRESET_MODE: preset_mode},
+                self._expected_values(
+                    (
+                        self._preset_mode_template,
+                        ATTR_PRESET_MODE,
+                        preset_mode,
+                        self._attr_preset_mode,
+                    )
+                ),
             )
 
     async def async_set_fan_mode(self, fan_mode: str) -> None:
@@ -724,10 +1144,18 @@ class TemplateClimate(TemplateEntity, ClimateEntity, RestoreEntity):
             self.async_write_ha_state()
 
         if self._set_fan_mode_script:
-            await self.async_run_script(
+            await self._async_run_action(
+                CONF_SET_FAN_MODE_ACTION,
                 self._set_fan_mode_script,
-                run_variables={ATTR_FAN_MODE: fan_mode},
-                context=self._context,
+                {ATTR_FAN_MODE: fan_mode},
+                self._expected_values(
+                    (
+                        self._fan_mode_template,
+                        ATTR_FAN_MODE,
+                        fan_mode,
+                        self._attr_fan_mode,
+                    )
+                ),
             )
 
     async def async_set_swing_mode(self, swing_mode: str) -> None:
@@ -737,15 +1165,43 @@ class TemplateClimate(TemplateEntity, ClimateEntity, RestoreEntity):
             self.async_write_ha_state()
 
         if self._set_swing_mode_script:
-            await self.async_run_script(
+            await self._async_run_action(
+                CONF_SET_SWING_MODE_ACTION,
                 self._set_swing_mode_script,
-                run_variables={ATTR_SWING_MODE: swing_mode},
-                context=self._context,
+                {ATTR_SWING_MODE: swing_mode},
+                self._expected_values(
+                    (
+                        self._swing_mode_template,
+                        ATTR_SWING_MODE,
+                        swing_mode,
+                        self._attr_swing_mode,
+                    )
+                ),
             )
 
     async def async_set_temperature(self, **kwargs) -> None:
         """Set new target temperature explicitly triggered by user or automation."""
         updated = False
+        expected = self._expected_values(
+            (
+                self._target_temperature_template,
+                ATTR_TEMPERATURE,
+                kwargs.get(ATTR_TEMPERATURE),
+                self._attr_target_temperature,
+            ),
+            (
+                self._target_temperature_high_template,
+                ATTR_TARGET_TEMP_HIGH,
+                kwargs.get(ATTR_TARGET_TEMP_HIGH),
+                self._attr_target_temperature_high,
+            ),
+            (
+                self._target_temperature_low_template,
+                ATTR_TARGET_TEMP_LOW,
+                kwargs.get(ATTR_TARGET_TEMP_LOW),
+                self._attr_target_temperature_low,
+            ),
+        )
 
         if kwargs.get(ATTR_HVAC_MODE, self._attr_hvac_mode) == HVACMode.HEAT_COOL:
             # Explicitly update high and low target temperatures if provided
@@ -782,15 +1238,16 @@ class TemplateClimate(TemplateEntity, ClimateEntity, RestoreEntity):
 
         # Run the set temperature script if defined
         if self._set_temperature_script:
-            await self.async_run_script(
+            await self._async_run_action(
+                CONF_SET_TEMPERATURE_ACTION,
                 self._set_temperature_script,
-                run_variables={
+                {
                     ATTR_TEMPERATURE: kwargs.get(ATTR_TEMPERATURE),
                     ATTR_TARGET_TEMP_HIGH: kwargs.get(ATTR_TARGET_TEMP_HIGH),
                     ATTR_TARGET_TEMP_LOW: kwargs.get(ATTR_TARGET_TEMP_LOW),
                     ATTR_HVAC_MODE: kwargs.get(ATTR_HVAC_MODE),
                 },
-                context=self._context,
+                expected,
             )
 
     async def async_set_humidity(self, humidity):
@@ -800,8 +1257,16 @@ class TemplateClimate(TemplateEntity, ClimateEntity, RestoreEntity):
             self.async_write_ha_state()
 
         if self._set_humidity_script:
-            await self.async_run_script(
+            await self._async_run_action(
+                CONF_SET_HUMIDITY_ACTION,
                 self._set_humidity_script,
-                run_variables={ATTR_HUMIDITY: humidity},
-                context=self._context,
+                {ATTR_HUMIDITY: humidity},
+                self._expected_values(
+                    (
+                        self._target_humidity_template,
+                        ATTR_HUMIDITY,
+                        humidity,
+                        self._attr_target_humidity,
+                    )
+                ),
             )
@@ -0,0 +1,182 @@
+"""Command queues shared by Template climates on the same gateway."""
+
+import asyncio
+from collections.abc import Callable, Coroutine
+from contextvars import ContextVar
+from datetime import timedelta
+import logging
+import time
+from typing import Any
+
+from homeassistant.core import CALLBACK_TYPE, Context, HomeAssistant, callback
+
+_LOGGER = logging.getLogger(__name__)
+
+DATA_COMMAND_QUEUES = "climate_template_command_queues"
+
+# the queue whose worker the current task was started from, if any
+_running_queue: ContextVar["CommandQueue | None"] = ContextVar(
+    "climate_template_running_queue", default=None
+)
+
+
+class QueuedCommand:
+    """A set action waiting for its turn on the gateway."""
+
+    def __init__(
+        self,
+        job: Callable[[], Coroutine[Any, Any, None]],
+        context: Context | None,
+        future: asyncio.Future,
+    ) -> None:
+        """Initialize the queued command."""
+        self.job = job
+        self.context = context
+        self.future = future
+        self.queued_at = time.monotonic()
+
+
+class CommandQueue:
+    """Run set actions one at a time with a minimum spacing between them."""
+
+    def __init__(self, hass: HomeAssistant, name: str) -> None:
+        """Initialize the queue."""
+        self._hass = hass
+        self._name = name
+        # spacing requested by each entity currently using the queue
+        self._spacings: dict[object, float] = {}
+        self._spacing = 0.0
+        # keyed by (entity_id, action) so a newer command supersedes a waiting one
+        self._commands: dict[tuple[str, str], QueuedCommand] = {}
+        self._task: asyncio.Task | None = None
+        self._running: QueuedCommand | None = None
+        self._last_sent = 0.0
+
+        self._max_depth = 0
+        self._sent = 0
+        self._superseded = 0
+        self._total_wait = 0.0
+        self._max_wait = 0.0
+
+    @callback
+    def async_register(self, spacing: timedelta) -> CALLBACK_TYPE:
+        """Add the spacing an entity needs, return a callback that removes it."""
+        token = object()
+        self._spacings[token] = spacing.total_seconds()
+        self._async_update_spacing()
+
+        @callback
+        def _async_unregister() -> None:
+            del self._spacings[token]
+            self._async_update_spacing()
+
+        return _async_unregister
+
+    @callback
+    def _async_update_spacing(self) -> None:
+        # use the largest spacing of the entities in the group
+        self._spacing = max(self._spacings.values(), default=0.0)
+
+    async def async_run(
+        self,
+        entity_id: str,
+        action: str,
+        job: Callable[[], Coroutine[Any, Any, None]],
+        context: Context | None = None,
+    ) -> bool:
+        """Queue a command, return True once it has run or False if superseded."""
+        if self._is_nested(context):
+            # a queued command waiting on another command of the same group would
+            # deadlock the queue, so run nested commands straight away
+            await job()
+            return True
+
+        key = (entity_id, action)
+        if (superseded := self._commands.pop(key, None)) is not None:
+            self._superseded += 1
+            _LOGGER.debug(
+                "Dropping superseded %s command for %s from queue %s",
+                action,
+                entity_id,
+                self._name,
+            )
+            if not superseded.future.done():
+                superseded.future.set_result(False)
+
+        future = self._hass.loop.create_future()
+        self._commands[key] = QueuedCommand(job, context, future)
+        self._max_depth = max(self._max_depth, len(self._commands))
+
+        if self._task is None:
+            # not started eagerly, a worker that finishes at once would leave
+            # _task set to a task that is already done
+            self._task = self._hass.async_create_background_task(
+                self._async_process(),
+                f"climate_template command queue {self._name}",
+                eager_start=False,
+            )
+
+        return await future
+
+    def _is_nested(self, context: Context | None) -> bool:
+        """Return whether a command was sent by the command that is running."""
+        # tasks started by the running command, e.g. event listeners, inherit the
+        # worker's context variables, so also require the command's own context
+        return (
+            _running_queue.get() is self
+            and context is not None
+            and self._running is not None
+            and self._running.context is not None
+            and context.id == self._running.context.id
+        )
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return queue depth and wait time metrics."""
+        return {
+            "depth": len(self._commands),
+            "max_depth": self._max_depth,
+            "sent": self._sent,
+            "superseded": self._superseded,
+            "mean_wait": round(self._total_wait / self._sent, 3) if self._sent else 0,
+            "max_wait": round(self._max_wait, 3),
+        }
+
+    async def _async_process(self) -> None:
+        _running_queue.set(self)
+        try:
+            while self._commands:
+                if (delay := self._last_sent + self._spacing - time.monotonic()) > 0:
+                    await asyncio.sleep(delay)
+                    continue
+
+                key = next(iter(self._commands))
+                command = self._commands.pop(key)
+
+                wait = time.monotonic() - command.queued_at
+                self._sent += 1
+                self._total_wait += wait
+                self._max_wait = max(self._max_wait, wait)
+
+                self._running = command
+                try:
+                    await command.job()
+                except Exception as err:  # noqa: BLE001
+                    if not command.future.done():
+                        command.future.set_exception(err)
+                else:
+                    if not command.future.done():
+                        command.future.set_result(True)
+                finally:
+                    self._running = None
+                    self._last_sent = time.monotonic()
+        finally:
+            self._task = None
+
+
+@callback
+def async_get_command_queue(hass: HomeAssistant, name: str) -> CommandQueue:
+    """Return the shared command queue for a group, creating it if needed."""
+    queues: dict[str, CommandQueue] = hass.data.setdefault(DATA_COMMAND_QUEUES, {})
+    if (queue := queues.get(name)) is None:
+        queue = queues[name] = CommandQueue(hass, name)
+    return queue
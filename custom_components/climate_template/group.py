@@ -0,0 +1,177 @@
+"""Zone aggregation for Template climates controlling a group of zones."""
+
+import asyncio
+from collections import Counter
+from collections.abc import Callable
+from typing import Any
+
+from homeassistant.components.climate import DATA_COMPONENT, ClimateEntity
+from homeassistant.components.climate.const import (
+    ATTR_CURRENT_TEMPERATURE,
+    ATTR_HVAC_ACTION,
+    ATTR_HVAC_MODE,
+    HVACAction,
+)
+from homeassistant.const import STATE_UNAVAILABLE, STATE_UNKNOWN
+from homeassistant.core import (
+    CALLBACK_TYPE,
+    Event,
+    EventStateChangedData,
+    HomeAssistant,
+    State,
+    callback,
+)
+from homeassistant.helpers.event import async_track_state_change_event
+
+# the reported hvac action of a group is the first of these that any zone reports
+HVAC_ACTION_PRIORITY = (
+    HVACAction.HEATING,
+    HVACAction.COOLING,
+    HVACAction.DRYING,
+    HVACAction.PREHEATING,
+    HVACAction.DEFROSTING,
+    HVACAction.FAN,
+    HVACAction.IDLE,
+    HVACAction.OFF,
+)
+
+
+@callback
+def async_get_climate(hass: HomeAssistant, entity_id: str) -> ClimateEntity | None:
+    """Return the climate entity with an entity id, if it is set up."""
+    # look zones up in the climate component, so climates need no registry of
+    # their own
+    if (component := hass.data.get(DATA_COMPONENT)) is None:
+        return None
+    return component.get_entity(entity_id)
+
+
+class ZoneAggregator:
+    """Incrementally aggregate the state of a group's zones."""
+
+    def __init__(
+        self, hass: HomeAssistant, zones: list[str], on_update: Callable[[], None]
+    ) -> None:
+        """Initialize the aggregator."""
+        self._hass = hass
+        self._zones = zones
+        self._on_update = on_update
+        self._update_handle: asyncio.Handle | None = None
+
+        self._contributions: dict[str, tuple[float | None, str | None, str | None]] = {}
+        self._temperature_sum = 0.0
+        self._temperature_count = 0
+        self._actions: Counter[str] = Counter()
+        self._modes: Counter[str] = Counter()
+
+    @callback
+    def async_start(self) -> CALLBACK_TYPE:
+        """Seed the aggregates and follow zone state changes."""
+        for entity_id in self._zones:
+            self._async_apply(entity_id, self._hass.states.get(entity_id))
+        self._async_schedule_update()
+        unsubscribe = async_track_state_change_event(
+            self._hass, self._zones, self._async_state_changed
+        )
+
+        @callback
+        def _async_stop() -> None:
+            unsubscribe()
+            if self._update_handle is not None:
+                self._update_handle.cancel()
+                self._update_handle = None
+
+        return _async_stop
+
+    @property
+    def current_temperature(self) -> float | None:
+        """Return the mean current temperature of the zones."""
+        if not self._temperature_count:
+            return None
+        return round(self._temperature_sum / self._temperature_count, 2)
+
+    @property
+    def hvac_actions(self) -> list[str]:
+        """Return every hvac action reported by a zone."""
+        return sorted(action for action, count in self._actions.items() if count)
+
+    @property
+    def hvac_action(self) -> HVACAction | None:
+        """Return the most significant hvac action reported by a zone."""
+        for action in HVAC_ACTION_PRIORITY:
+            if self._actions[action]:
+                return action
+        return None
+
+    @property
+    def hvac_mode(self) -> str | None:
+        """Return the hvac mode most zones are in."""
+        if not (modes := +self._modes):
+            return None
+        return modes.most_common(1)[0][0]
+
+    @callback
+    def async_affected_zones(self, values: dict[str, Any]) -> list[str]:
+        """Return the zones whose state differs from the given values."""
+        values = {key: value for key, value in values.items() if value is not None}
+        affected = []
+        for entity_id in self._zones:
+            state = self._hass.states.get(entity_id)
+            if state is None or state.state in (STATE_UNKNOWN, STATE_UNAVAILABLE):
+                affected.append(entity_id)
+                continue
+            for key, value in values.items():
+                current = (
+                    state.state if key == ATTR_HVAC_MODE else state.attributes.get(key)
+                )
+                if current != value:
+                    affected.append(entity_id)
+                    break
+        return affected
+
+    @callback
+    def _async_state_changed(self, event: Event[EventStateChangedData]) -> None:
+        self._async_apply(event.data["entity_id"], event.data["new_state"])
+        self._async_schedule_update()
+
+    @callback
+    def _async_apply(self, entity_id: str, state: State | None) -> None:
+        temperature, action, mode = self._contributions.pop(
+            entity_id, (None, None, None)
+        )
+        if temperature is not None:
+            self._temperature_sum -= temperature
+            self._temperature_count -= 1
+        if action is not None:
+            self._actions[action] -= 1
+        if mode is not None:
+            self._modes[mode] -= 1
+
+        if state is None or state.state in (STATE_UNKNOWN, STATE_UNAVAILABLE):
+            return
+
+        try:
+            temperature = float(state.attributes[ATTR_CURRENT_TEMPERATURE])
+        except (KeyError, TypeError, ValueError):
+            temperature = None
+        action = state.attributes.get(ATTR_HVAC_ACTION)
+        mode = state.state
+
+        if temperature is not None:
+            self._temperature_sum += temperature
+            self._temperature_count += 1
+        if action is not None:
+            self._actions[action] += 1
+        self._modes[mode] += 1
+        self._contributions[entity_id] = (temperature, action, mode)
+
+    @callback
+    def _async_schedule_update(self) -> None:
+        # coalesce zone changes that arrive together into a single update
+        if self._update_handle is None:
+            self._update_handle = self._hass.loop.call_soon(self._async_update)
+
+    @callback
+    def _async_update(self) -> None:
+        self._update_handle = None
+        self._on_update()
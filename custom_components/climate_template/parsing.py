@@ -0,0 +1,103 @@
+"""Accounting of template results that Template climates could not use."""
+
+from collections.abc import Callable
+from functools import partial
+import logging
+from typing import Any
+
+from homeassistant.const import STATE_UNAVAILABLE, STATE_UNKNOWN
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.event import async_call_later
+
+_LOGGER = logging.getLogger(__name__)
+
+UNPARSED_STATES = frozenset((STATE_UNKNOWN, STATE_UNAVAILABLE))
+
+# errors for the same attribute are logged at most once per interval (in seconds)
+PARSE_ERROR_LOG_INTERVAL = 300
+
+
+def is_unparsed(value: Any) -> bool:
+    """Return whether a template result is unknown or unavailable."""
+    # template results may be lists or dicts, which cannot be looked up in a set
+    return isinstance(value, str) and value in UNPARSED_STATES
+
+
+class ParseErrors:
+    """Count template results that could not be parsed, logging them sparingly.
+
+    on_report is called whenever errors are logged, so the counts are published
+    at the same rate as the log instead of on every error.
+    """
+
+    def __init__(
+        self, hass: HomeAssistant, entity_id: str, on_report: Callable[[], None]
+    ) -> None:
+        """Initialize the counters."""
+        self._hass = hass
+        self._entity_id = entity_id
+        self._on_report = on_report
+        self._counts: dict[str, int] = {}
+        self._suppressed: dict[str, int] = {}
+        self._last_errors: dict[str, tuple[str, tuple]] = {}
+        self._logged_at: dict[str, float] = {}
+        self._reports: dict[str, CALLBACK_TYPE] = {}
+
+    @callback
+    def record(self, attribute: str, message: str, *args: Any) -> None:
+        """Count an error and log it unless one was logged recently."""
+        self._counts[attribute] = self._counts.get(attribute, 0) + 1
+
+        now = self._hass.loop.time()
+        if (logged_at := self._logged_at.get(attribute)) is not None and (
+            now - logged_at < PARSE_ERROR_LOG_INTERVAL
+        ):
+            self._suppressed[attribute] = self._suppressed.get(attribute, 0) + 1
+            self._last_errors[attribute] = (message, args)
+            # report the suppressed errors once the interval is over
+            if attribute not in self._reports:
+                self._reports[attribute] = async_call_later(
+                    self._hass,
+                    logged_at + PARSE_ERROR_LOG_INTERVAL - now,
+                    partial(self._async_report, attribute),
+                )
+            return
+
+        self._log(attribute, now, message, args)
+
+    @callback
+    def _async_report(self, attribute: str, _now) -> None:
+        """Log the last of the errors suppressed during the interval."""
+        del self._reports[attribute]
+        if attribute in self._last_errors:
+            message, args = self._last_errors[attribute]
+            self._log(attribute, self._hass.loop.time(), message, args)
+
+    def _log(self, attribute: str, now: float, message: str, args: tuple) -> None:
+        """Log an error with the number of errors suppressed before it."""
+        self._logged_at[attribute] = now
+        self._last_errors.pop(attribute, None)
+        if cancel := self._reports.pop(attribute, None):
+            cancel()
+
+        if suppressed := self._suppressed.pop(attribute, 0):
+            _LOGGER.error(
+                "%s: " + message + " (%d similar errors since the last report)",
+                self._entity_id,
+                *args,
+                suppressed,
+            )
+        else:
+            _LOGGER.error("%s: " + message, self._entity_id, *args)
+        self._on_report()
+
+    @callback
+    def async_cancel(self) -> None:
+        """Cancel the pending reports of suppressed errors."""
+        for cancel in self._reports.values():
+            cancel()
+        self._reports.clear()
+
+    def as_dict(self) -> dict[str, int]:
+        """Return the number of errors of each attribute."""
+        return dict(self._counts)
@@ -0,0 +1,85 @@
+"""Persistent store of parsed template results for Template climates."""
+
+import asyncio
+from typing import Any
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.start import async_at_started
+from homeassistant.helpers.storage import Store
+
+DATA_RESULT_STORE = "climate_template_result_store"
+
+STORAGE_KEY = "climate_template.template_results"
+STORAGE_VERSION = 1
+SAVE_DELAY = 10
+
+
+class TemplateResultStore:
+    """Last parsed template results of every climate.
+
+    Results are keyed by unique id, or by entity id for climates without one.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the store."""
+        self._hass = hass
+        self._store: Store[dict[str, dict[str, Any]]] = Store(
+            hass, STORAGE_VERSION, STORAGE_KEY
+        )
+        self._results: dict[str, dict[str, Any]] = {}
+        # climates set up since the results were loaded
+        self._claimed: set[str] = set()
+        self._load_task: asyncio.Task | None = None
+
+    async def async_load(self) -> None:
+        """Load the stored results once."""
+        if self._load_task is None:
+            self._load_task = self._hass.async_create_task(self._async_load())
+        await self._load_task
+
+    async def _async_load(self) -> None:
+        if (results := await self._store.async_load()) is not None:
+            self._results = results
+        # climates are all set up by the time Home Assistant has started, so
+        # only prune when loaded during startup, never on a reload
+        if not self._hass.is_running:
+            async_at_started(self._hass, self._async_prune)
+
+    @callback
+    def async_claim(self, key: str) -> None:
+        """Mark the results of a climate as in use."""
+        self._claimed.add(key)
+
+    @callback
+    def async_get(self, key: str) -> dict[str, Any] | None:
+        """Return the stored results of a climate."""
+        return self._results.get(key)
+
+    @callback
+    def async_update(self, key: str, attribute: str, value: Any) -> None:
+        """Store a result of a climate, saving it after a delay."""
+        results = self._results.setdefault(key, {})
+        if attribute in results and results[attribute] == value:
+            return
+        results[attribute] = value
+        self._async_schedule_save()
+
+    @callback
+    def _async_prune(self, _hass: HomeAssistant) -> None:
+        """Forget the results of climates that were not set up."""
+        if removed := self._results.keys() - self._claimed:
+            for key in removed:
+                del self._results[key]
+            self._async_schedule_save()
+
+    @callback
+    def _async_schedule_save(self) -> None:
+        self._store.async_delay_save(lambda: self._results, SAVE_DELAY)
+
+
+async def async_get_result_store(hass: HomeAssistant) -> TemplateResultStore:
+    """Return the loaded result store, creating it if needed."""
+    if (store := hass.data.get(DATA_RESULT_STORE)) is None:
+        store = hass.data[DATA_RESULT_STORE] = TemplateResultStore(hass)
+    await store.async_load()
+    return store
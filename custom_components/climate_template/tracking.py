@@ -0,0 +1,225 @@
+"""Command round-trip tracking for Template climates."""
+
+from collections.abc import Callable, Coroutine
+from datetime import timedelta
+import itertools
+import logging
+import time
+from typing import Any
+
+from homeassistant.core import CALLBACK_TYPE, callback
+from homeassistant.helpers.entity import Entity
+from homeassistant.helpers.event import async_call_later
+
+_LOGGER = logging.getLogger(__name__)
+
+EVENT_COMMAND_CONFIRMED = "climate_template_command_confirmed"
+EVENT_COMMAND_TIMEOUT = "climate_template_command_timeout"
+
+# upper bounds (in seconds) of the round-trip latency histogram buckets
+LATENCY_BUCKETS = (0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+_command_ids = itertools.count(1)
+
+
+def _empty_histogram() -> list[int]:
+    return [0] * (len(LATENCY_BUCKETS) + 1)
+
+
+class PendingCommand:
+    """A command that is waiting for its template to confirm it."""
+
+    def __init__(
+        self,
+        action: str,
+        expected: dict[str, Any],
+        resend: Callable[[], Coroutine[Any, Any, None]],
+    ) -> None:
+        """Initialize the pending command."""
+        self.command_id = next(_command_ids)
+        self.action = action
+        self.expected = expected
+        self.resend = resend
+        self.attempt = 1
+        self.sent_at = time.monotonic()
+        self.cancel_timeout: CALLBACK_TYPE | None = None
+
+
+class CommandTracker:
+    """Match set commands against the template updates that confirm them."""
+
+    def __init__(
+        self,
+        entity: Entity,
+        timeout: timedelta,
+        retries: int,
+        on_timeout: Callable[[], None],
+        tolerance: float = 0.0,
+    ) -> None:
+        """Initialize the tracker."""
+        self._entity = entity
+        self._on_timeout = on_timeout
+        self._timeout = timeout
+        self._retries = retries
+        self._tolerance = tolerance
+        self._pending: dict[str, PendingCommand] = {}
+        self._histograms: dict[str, list[int]] = {}
+        self._timeouts: dict[str, int] = {}
+
+    @callback
+    def async_track(
+        self,
+        action: str,
+        expected: dict[str, Any],
+        resend: Callable[[], Coroutine[Any, Any, None]],
+    ) -> None:
+        """Start tracking a command, superseding any pending one for the action."""
+        self.async_cancel(action)
+        command = PendingCommand(action, expected, resend)
+        self._pending[action] = command
+        self._async_schedule_timeout(command)
+
+    @callback
+    def async_confirm(self, attribute: str, value: Any) -> bool:
+        """Handle a template update, return True if it completed a command."""
+        confirmed = False
+        for command in list(self._pending.values()):
+            if attribute not in command.expected:
+                continue
+            if not self._matches(command.expected[attribute], value):
+                continue
+            del command.expected[attribute]
+            if not command.expected:
+                self._async_complete(command)
+                confirmed = True
+        return confirmed
+
+    def _matches(self, expected: Any, value: Any) -> bool:
+        # devices round setpoints to their own step, so numbers match within tolerance
+        if isinstance(expected, (int, float)) and isinstance(value, (int, float)):
+            return abs(expected - value) <= self._tolerance
+        return expected == value
+
+    @callback
+    def async_cancel_all(self) -> None:
+        """Stop tracking all pending commands."""
+        for action in list(self._pending):
+            self.async_cancel(action)
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the latency histograms and timeout counts per action."""
+        return {
+            action: {
+                "count": sum(self._histograms.get(action, ())),
+                "timeouts": self._timeouts.get(action, 0),
+                "buckets": dict(
+                    zip(
+                        [*(str(bound) for bound in LATENCY_BUCKETS), "+Inf"],
+                        self._histograms.get(action, _empty_histogram()),
+                    )
+                ),
+            }
+            for action in sorted(self._histograms.keys() | self._timeouts.keys())
+        }
+
+    @callback
+    def async_cancel(self, action: str) -> None:
+        """Stop tracking the pending command for an action."""
+        if (command := self._pending.pop(action, None)) is None:
+            return
+        if command.cancel_timeout:
+            command.cancel_timeout()
+
+    @callback
+    def _async_schedule_timeout(self, command: PendingCommand) -> None:
+        @callback
+        def _timed_out(_now) -> None:
+            command.cancel_timeout = None
+            self._async_timeout(command)
+
+        command.cancel_timeout = async_call_later(
+            self._entity.hass, self._timeout, _timed_out
+        )
+
+    @callback
+    def _async_complete(self, command: PendingCommand) -> None:
+        self.async_cancel(command.action)
+        latency = time.monotonic() - command.sent_at
+
+        histogram = self._histograms.setdefault(command.action, _empty_histogram())
+        for index, bound in enumerate(LATENCY_BUCKETS):
+            if latency <= bound:
+                histogram[index] += 1
+                break
+        else:
+            histogram[-1] += 1
+
+        self._entity.hass.bus.async_fire(
+            EVENT_COMMAND_CONFIRMED,
+            {
+                "entity_id": self._entity.entity_id,
+                "action": command.action,
+                "command_id": command.command_id,
+                "attempt": command.attempt,
+                "latency": round(latency, 3),
+            },
+        )
+
+    @callback
+    def _async_timeout(self, command: PendingCommand) -> None:
+        if self._pending.get(command.action) is not command:
+            return
+
+        retrying = command.attempt <= self._retries
+        _LOGGER.warning(
+            "Command %s (%s) for %s was not confirmed within %s (attempt %s)",
+            command.command_id,
+            command.action,
+            self._entity.entity_id,
+            self._timeout,
+            command.attempt,
+        )
+        self._async_fire_timeout(command, retrying)
+
+        if not retrying:
+            del self._pending[command.action]
+            return
+
+        command.attempt += 1
+        command.sent_at = time.monotonic()
+        self._async_schedule_timeout(command)
+        self._entity.hass.async_create_task(
+            self._async_resend(command),
+            f"climate_template resend {command.action} {self._entity.entity_id}",
+        )
+
+    async def _async_resend(self, command: PendingCommand) -> None:
+        try:
+            await command.resend()
+        except Exception as err:  # noqa: BLE001
+            _LOGGER.error(
+                "Could not resend command %s (%s) for %s: %s",
+                command.command_id,
+                command.action,
+                self._entity.entity_id,
+                err,
+            )
+            if self._pending.get(command.action) is command:
+                self.async_cancel(command.action)
+                self._async_fire_timeout(command, False)
+
+    @callback
+    def _async_fire_timeout(self, command: PendingCommand, retrying: bool) -> None:
+        self._timeouts[command.action] = self._timeouts.get(command.action, 0) + 1
+        self._entity.hass.bus.async_fire(
+            EVENT_COMMAND_TIMEOUT,
+            {
+                "entity_id": self._entity.entity_id,
+                "action": command.action,
+                "command_id": command.command_id,
+                "attempt": command.attempt,
+                "expected": dict(command.expected),
+                "retrying": retrying,
+            },
+        )
+        self._on_timeout()
@@ -0,0 +1,195 @@
+"""Measure the memory used by each Template climate entity.
+
+Usage: python scripts/benchmark_memory.py [--count N] [--tolerance PERCENT]
+
+Adds COUNT entities for a minimal, a typical and a fully configured climate to
+a running Home Assistant instance and reports the bytes allocated per entity,
+as traced by tracemalloc. This covers the entity itself, its template tracking
+and listeners, and its state. Exits with an error if any profile goes over its
+budget.
+"""
+
+import argparse
+import asyncio
+import gc
+from datetime import timedelta
+import logging
+from pathlib import Path
+import sys
+from tempfile import TemporaryDirectory
+import tracemalloc
+
+from homeassistant import core, loader
+from homeassistant.components.climate import DOMAIN as CLIMATE_DOMAIN
+from homeassistant.components.template.helpers import rewrite_legacy_to_modern_config
+from homeassistant.helpers import (
+    area_registry as ar,
+    device_registry as dr,
+    entity,
+    entity_registry as er,
+    floor_registry as fr,
+    label_registry as lr,
+    restore_state as rs,
+    translation,
+)
+from homeassistant.helpers.entity_platform import EntityPlatform
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from custom_components.climate_template import climate  # noqa: E402
+from custom_components.climate_template.climate import (  # noqa: E402
+    DOMAIN,
+    PLATFORM_SCHEMA,
+    TemplateClimate,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+ACTION = [{"service": "script.turn_on", "target": {"entity_id": "script.aircon"}}]
+
+PROFILES = {
+    "minimal": {},
+    "typical": {
+        "current_temperature_template": "{{ states('sensor.temperature') }}",
+        "hvac_mode_template": "{{ states('input_select.hvac_mode') }}",
+        "set_hvac_mode": ACTION,
+        "set_temperature": ACTION,
+        "modes": ["off", "heat", "cool"],
+    },
+    "full": {
+        "availability_template": "{{ is_state('binary_sensor.node', 'on') }}",
+        "current_temperature_template": "{{ states('sensor.temperature') }}",
+        "current_humidity_template": "{{ states('sensor.humidity') }}",
+        "min_humidity_template": "{{ 30 }}",
+        "max_humidity_template": "{{ 70 }}",
+        "target_humidity_template": "{{ states('input_number.humidity') }}",
+        "target_temperature_template": "{{ states('input_number.temperature') }}",
+        "target_temperature_high_template": "{{ states('input_number.high') }}",
+        "target_temperature_low_template": "{{ states('input_number.low') }}",
+        "hvac_mode_template": "{{ states('input_select.hvac_mode') }}",
+        "fan_mode_template": "{{ states('input_select.fan_mode') }}",
+        "preset_mode_template": "{{ states('input_select.preset_mode') }}",
+        "swing_mode_template": "{{ states('input_select.swing_mode') }}",
+        "hvac_action_template": "{{ states('sensor.hvac_action') }}",
+        "min_temp_template": "{{ 16 }}",
+        "max_temp_template": "{{ 30 }}",
+        "set_humidity": ACTION,
+        "set_temperature": ACTION,
+        "set_hvac_mode": ACTION,
+        "set_fan_mode": ACTION,
+        "set_preset_mode": ACTION,
+        "set_swing_mode": ACTION,
+        "modes": ["off", "heat", "cool", "heat_cool"],
+    },
+}
+
+# states the templates render, so every entity holds real results
+INPUT_STATES = {
+    "binary_sensor.node": "on",
+    "sensor.temperature": "21.5",
+    "sensor.humidity": "45",
+    "sensor.hvac_action": "heating",
+    "input_number.humidity": "50",
+    "input_number.temperature": "22",
+    "input_number.high": "24",
+    "input_number.low": "19",
+    "input_select.hvac_mode": "heat",
+    "input_select.fan_mode": "auto",
+    "input_select.preset_mode": "eco",
+    "input_select.swing_mode": "on",
+}
+
+# bytes per entity, the benchmark fails when a profile goes over its budget.
+# Budgets are the measurements from before the memory work, or the improved
+# measurement where that work reduced it, so no profile can regress.
+BUDGETS = {
+    "minimal": 6_509,
+    "typical": 16_384,
+    "full": 59_897,
+}
+
+
+async def async_start_hass(config_dir: str) -> core.HomeAssistant:
+    """Start a bare Home Assistant instance that entities can be added to."""
+    hass = core.HomeAssistant(config_dir)
+    entity.async_setup(hass)
+    loader.async_setup(hass)
+    translation.async_setup(hass)
+    for registry in (ar, fr, lr, dr, er, rs):
+        await registry.async_load(hass)
+    await hass.async_start()
+    for entity_id, state in INPUT_STATES.items():
+        hass.states.async_set(entity_id, state)
+    return hass
+
+
+async def async_measure(profile: dict, count: int) -> float:
+    """Return the bytes allocated per entity for a profile."""
+    with TemporaryDirectory() as config_dir:
+        hass = await async_start_hass(config_dir)
+        platform = EntityPlatform(
+            hass=hass,
+            logger=_LOGGER,
+            domain=CLIMATE_DOMAIN,
+            platform_name=DOMAIN,
+            platform=climate,
+            scan_interval=timedelta(seconds=30),
+            entity_namespace=None,
+        )
+        configs = [
+            rewrite_legacy_to_modern_config(
+                hass,
+                PLATFORM_SCHEMA(
+                    {**profile, "platform": DOMAIN, "name": f"Climate {index}"}
+                ),
+                {},
+            )
+            for index in range(count)
+        ]
+
+        gc.collect()
+        tracemalloc.start()
+        before = tracemalloc.take_snapshot()
+        await platform.async_add_entities(
+            [TemplateClimate(hass, config, None) for config in configs]
+        )
+        await hass.async_block_till_done()
+        gc.collect()
+        after = tracemalloc.take_snapshot()
+        tracemalloc.stop()
+
+        await hass.async_stop()
+
+    allocated = sum(stat.size_diff for stat in after.compare_to(before, "filename"))
+    return allocated / count
+
+
+async def async_run(count: int, tolerance: float) -> bool:
+    """Run the benchmark for every profile, return False if over budget."""
+    within_budget = True
+    for name, profile in PROFILES.items():
+        per_entity = await async_measure(profile, count)
+        budget = BUDGETS[name] * (1 + tolerance / 100)
+        status = "ok" if per_entity <= budget else "OVER BUDGET"
+        within_budget &= per_entity <= budget
+        print(
+            f"{name}: {per_entity:,.0f} bytes per entity (budget {budget:,.0f}) {status}"
+        )
+    return within_budget
+
+
+def main() -> None:
+    """Handle command line arguments."""
+    logging.basicConfig(level=logging.ERROR)
+    parser = argparse.ArgumentParser(description="Measure Template climate memory.")
+    parser.add_argument("--count", type=int, default=200)
+    parser.add_argument(
+        "--tolerance", type=float, default=0, help="allowed percentage over budget"
+    )
+    args = parser.parse_args()
+    if not asyncio.run(async_run(args.count, args.tolerance)):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
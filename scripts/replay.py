@@ -0,0 +1,166 @@
+"""Replay a Template climate capture against a local Home Assistant instance.
+
+Usage: python scripts/replay.py CAPTURE_FILE CONFIG_FILE
+
+CAPTURE_FILE is a JSONL file written by the ``capture_file`` option and
+CONFIG_FILE is a YAML mapping of entity ids to ``climate_template`` configs.
+Inputs are fed to the entities as fast as possible, in the batches Home
+Assistant delivered them in, and the number of template results, batches,
+state writes and script runs is reported for each entity. Results of templates
+that the replayed config does not have are skipped.
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+from pathlib import Path
+import sys
+from timeit import default_timer as timer
+
+import yaml
+
+from homeassistant import core
+from homeassistant.components.template.helpers import rewrite_legacy_to_modern_config
+from homeassistant.const import CONF_UNIQUE_ID
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from custom_components.climate_template.capture import (  # noqa: E402
+    CAPTURE_ACTION,
+    CAPTURE_INPUT,
+)
+from custom_components.climate_template.climate import (  # noqa: E402
+    CONF_CAPTURE_FILE,
+    PLATFORM_SCHEMA,
+    TEMPLATE_ATTRIBUTES,
+    TemplateClimate,
+)
+
+# template property of each update handler
+HANDLER_TEMPLATES = {
+    handler: template_attr for _, template_attr, _, handler in TEMPLATE_ATTRIBUTES
+}
+
+
+class ReplayClimate(TemplateClimate):
+    """Template climate that counts writes and script runs instead of doing them."""
+
+    def __init__(self, hass, config, unique_id):
+        """Initialize the replay climate."""
+        super().__init__(hass, config, unique_id)
+        self.inputs = 0
+        self.batches = 0
+        self.writes = 0
+        self.script_runs = 0
+
+    def async_write_ha_state(self) -> None:
+        """Count a state write."""
+        self.writes += 1
+
+    async def async_run_script(self, script, *, run_variables=None, context=None):
+        """Count a script run."""
+        self.script_runs += 1
+
+
+def create_entities(hass: core.HomeAssistant, configs: dict) -> dict:
+    """Return a replay climate for each entity id in the configs."""
+    entities: dict[str, ReplayClimate] = {}
+    for entity_id, raw_config in configs.items():
+        raw_config = {**raw_config, "platform": "climate_template"}
+        raw_config.pop(CONF_CAPTURE_FILE, None)
+        config = rewrite_legacy_to_modern_config(hass, PLATFORM_SCHEMA(raw_config), {})
+        entity = ReplayClimate(hass, config, config.get(CONF_UNIQUE_ID))
+        entity.entity_id = entity_id
+        entities[entity_id] = entity
+    return entities
+
+
+async def async_replay_records(
+    hass: core.HomeAssistant, entities: dict, records: list[dict]
+) -> int:
+    """Feed capture records to the entities, return the number skipped."""
+    # timestamps are only comparable within one Home Assistant run
+    records = sorted(records, key=lambda record: (record["s"], record["t"]))
+
+    skipped = 0
+    batch_key = None
+    batch_entity: ReplayClimate | None = None
+
+    def end_batch() -> None:
+        # Home Assistant writes the state once after each batch of results
+        nonlocal batch_key, batch_entity
+        if batch_entity is not None:
+            batch_entity.batches += 1
+            batch_entity.async_write_ha_state()
+        batch_key = batch_entity = None
+
+    for record in records:
+        if (entity := entities.get(record["e"])) is None:
+            skipped += 1
+            continue
+        if record["k"] != CAPTURE_INPUT:
+            end_batch()
+            if record["k"] == CAPTURE_ACTION:
+                # run variables also hold the arguments a service call left out
+                kwargs = {
+                    key: value
+                    for key, value in record["v"].items()
+                    if value is not None
+                }
+                hass.async_create_task(
+                    getattr(entity, f"async_{record['n']}")(**kwargs)
+                )
+            continue
+
+        if (template_attr := HANDLER_TEMPLATES.get(record["n"])) and getattr(
+            entity, template_attr
+        ) is None:
+            continue
+        if (key := (record["e"], record["s"], record["b"])) != batch_key:
+            end_batch()
+            batch_key, batch_entity = key, entity
+        entity.inputs += 1
+        getattr(entity, record["n"])(record["v"])
+    end_batch()
+    await hass.async_block_till_done()
+    return skipped
+
+
+async def async_replay(capture_file: str, config_file: str) -> None:
+    """Replay a capture and print a report."""
+    hass = core.HomeAssistant(str(Path(config_file).resolve().parent))
+
+    configs = yaml.safe_load(Path(config_file).read_text(encoding="utf-8"))
+    entities = create_entities(hass, configs)
+
+    with open(capture_file, encoding="utf-8") as file:
+        records = [json.loads(line) for line in file if line.strip()]
+
+    start = timer()
+    skipped = await async_replay_records(hass, entities, records)
+    runtime = timer() - start
+
+    print(f"Replayed {len(records) - skipped} records in {runtime:.3f}s")
+    if skipped:
+        print(f"Skipped {skipped} records for entities missing from {config_file}")
+    for entity_id, entity in entities.items():
+        print(
+            f"{entity_id}: {entity.inputs} template results in {entity.batches}"
+            f" batches, {entity.writes} writes, {entity.script_runs} script runs"
+        )
+    await hass.async_stop()
+
+
+def main() -> None:
+    """Handle command line arguments."""
+    logging.basicConfig(level=logging.WARNING)
+    parser = argparse.ArgumentParser(description="Replay a Template climate capture.")
+    parser.add_argument("capture_file")
+    parser.add_argument("config_file")
+    args = parser.parse_args()
+    asyncio.run(async_replay(args.capture_file, args.config_file))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,129 @@
+"""Tests for event capture and replay."""
+
+from datetime import timedelta
+import json
+from pathlib import Path
+
+from homeassistant.core import HomeAssistant
+from homeassistant.setup import async_setup_component
+from homeassistant.util import dt as dt_util
+from pytest_homeassistant_custom_component.common import (
+    async_fire_time_changed,
+    async_mock_service,
+)
+
+from custom_components.climate_template.capture import (
+    CAPTURE_ACTION,
+    CAPTURE_INPUT,
+    CAPTURE_WRITE,
+    FLUSH_DELAY,
+    async_get_capture_writer,
+)
+from scripts.replay import async_replay_records, create_entities
+
+CONFIG = {
+    "current_temperature_template": "{{ states('sensor.temperature') }}",
+    "hvac_action_template": "{{ states('sensor.hvac_action') }}",
+    "modes": ["off", "heat"],
+    "set_hvac_mode": [{"service": "test.send", "data": {"mode": "{{ hvac_mode }}"}}],
+}
+
+
+async def _read_capture(hass: HomeAssistant, path: Path) -> list[dict]:
+    """Flush the capture writers and return the records written to a file."""
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=FLUSH_DELAY))
+    await hass.async_block_till_done(wait_background_tasks=True)
+    text = await hass.async_add_executor_job(path.read_text)
+    return [json.loads(line) for line in text.splitlines()]
+
+
+async def test_records_keep_json_values(hass: HomeAssistant, tmp_path: Path) -> None:
+    """Test lists and dicts are written as JSON, other objects as strings."""
+    hass.config.config_dir = str(tmp_path)
+    writer = async_get_capture_writer(hass, "capture.jsonl")
+    assert async_get_capture_writer(hass, "capture.jsonl") is writer
+
+    writer.async_record("climate.a", CAPTURE_INPUT, "_update_hvac_action", ["a"], 1)
+    writer.async_record("climate.a", CAPTURE_ACTION, "set_hvac_mode", {"m": "heat"})
+    writer.async_record("climate.a", CAPTURE_WRITE, None, timedelta(seconds=1))
+
+    records = await _read_capture(hass, tmp_path / "capture.jsonl")
+
+    assert [(record["k"], record["b"], record["v"]) for record in records] == [
+        (CAPTURE_INPUT, 1, ["a"]),
+        (CAPTURE_ACTION, None, {"m": "heat"}),
+        (CAPTURE_WRITE, None, "0:00:01"),
+    ]
+    assert len({record["s"] for record in records}) == 1
+
+
+async def test_replay_passes_captured_values(hass: HomeAssistant) -> None:
+    """Test replayed results reach the handlers unchanged, batch by batch."""
+    entities = create_entities(hass, {"climate.a": CONFIG})
+    entity = entities["climate.a"]
+    received = []
+    entity._update_hvac_action = received.append
+
+    records = [
+        {"s": "1", "t": 2.0, "b": 1, "e": "climate.a", "k": CAPTURE_INPUT}
+        | {"n": "_update_hvac_action", "v": ["heating", "idle"]},
+        {"s": "1", "t": 1.0, "b": 1, "e": "climate.a", "k": CAPTURE_INPUT}
+        | {"n": "_update_current_temp", "v": 21.5},
+        {"s": "1", "t": 3.0, "b": 2, "e": "climate.a", "k": CAPTURE_INPUT}
+        | {"n": "_update_current_temp", "v": 22},
+        {"s": "1", "t": 4.0, "b": None, "e": "climate.b", "k": CAPTURE_WRITE}
+        | {"n": None, "v": "off"},
+    ]
+    assert await async_replay_records(hass, entities, records) == 1
+
+    assert received == [["heating", "idle"]]
+    assert entity.current_temperature == 22
+    assert (entity.inputs, entity.batches, entity.writes) == (3, 2, 2)
+
+
+async def test_capture_and_replay(
+    hass: HomeAssistant, enable_custom_integrations: None, tmp_path: Path
+) -> None:
+    """Test replaying a capture repeats the template results and actions."""
+    hass.config.config_dir = str(tmp_path)
+    calls = async_mock_service(hass, "test", "send")
+    hass.states.async_set("sensor.temperature", "21.5")
+    hass.states.async_set("sensor.hvac_action", "idle")
+    assert await async_setup_component(
+        hass,
+        "climate",
+        {
+            "climate": {
+                "platform": "climate_template",
+                "name": "a",
+                "capture_file": "capture.jsonl",
+                **CONFIG,
+            }
+        },
+    )
+    await hass.async_block_till_done()
+
+    hass.states.async_set("sensor.temperature", "22")
+    hass.states.async_set("sensor.hvac_action", "heating")
+    await hass.async_block_till_done()
+    await hass.services.async_call(
+        "climate",
+        "set_hvac_mode",
+        {"entity_id": "climate.a", "hvac_mode": "heat"},
+        blocking=True,
+    )
+    assert len(calls) == 1
+
+    records = await _read_capture(hass, tmp_path / "capture.jsonl")
+    kinds = [record["k"] for record in records]
+    assert kinds.count(CAPTURE_INPUT) == 4
+    assert kinds.count(CAPTURE_ACTION) == 1
+
+    entities = create_entities(hass, {"climate.a": CONFIG})
+    assert await async_replay_records(hass, entities, records) == 0
+
+    entity = entities["climate.a"]
+    assert (entity.inputs, entity.batches, entity.script_runs) == (4, 3, 1)
+    assert entity.current_temperature == 22
+    assert entity.hvac_action == "heating"
+    assert entity.hvac_mode == "heat"
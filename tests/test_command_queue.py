@@ -0,0 +1,176 @@
+"""Tests for the shared command queue."""
+
+import asyncio
+from datetime import timedelta
+import time
+
+import pytest
+
+from homeassistant.core import Context, HomeAssistant
+
+from custom_components.climate_template.command_queue import async_get_command_queue
+
+
+async def test_commands_run_in_order_with_spacing(hass: HomeAssistant) -> None:
+    """Test commands run one at a time, spaced by the largest spacing."""
+    queue = async_get_command_queue(hass, "ir")
+    queue.async_register(timedelta(seconds=0.05))
+    queue.async_register(timedelta(seconds=0.1))
+    sent: list[tuple[str, float]] = []
+
+    def job(name: str):
+        async def _job() -> None:
+            sent.append((name, time.monotonic()))
+
+        return _job
+
+    results = await asyncio.gather(
+        queue.async_run("climate.a", "set_hvac_mode", job("a")),
+        queue.async_run("climate.b", "set_hvac_mode", job("b")),
+        queue.async_run("climate.c", "set_hvac_mode", job("c")),
+    )
+
+    assert results == [True, True, True]
+    assert [name for name, _ in sent] == ["a", "b", "c"]
+    assert sent[1][1] - sent[0][1] >= 0.1
+    assert sent[2][1] - sent[1][1] >= 0.1
+    assert queue.as_dict()["sent"] == 3
+
+
+async def test_spacing_follows_registered_entities(hass: HomeAssistant) -> None:
+    """Test the spacing of a removed entity no longer applies."""
+    queue = async_get_command_queue(hass, "ir")
+    queue.async_register(timedelta(0))
+    unregister = queue.async_register(timedelta(seconds=10))
+    unregister()
+    sent: list[float] = []
+
+    async def job() -> None:
+        sent.append(time.monotonic())
+
+    async with asyncio.timeout(1):
+        await queue.async_run("climate.a", "set_hvac_mode", job)
+        await queue.async_run("climate.a", "set_fan_mode", job)
+
+    assert len(sent) == 2
+
+
+async def test_newer_command_supersedes_waiting_one(hass: HomeAssistant) -> None:
+    """Test a waiting command is dropped when a newer one is queued."""
+    queue = async_get_command_queue(hass, "ir")
+    release = asyncio.Event()
+    ran: list[str] = []
+
+    def job(name: str):
+        async def _job() -> None:
+            ran.append(name)
+            if name == "first":
+                await release.wait()
+
+        return _job
+
+    first = hass.async_create_task(
+        queue.async_run("climate.a", "set_temperature", job("first"))
+    )
+    await asyncio.sleep(0)
+    second = hass.async_create_task(
+        queue.async_run("climate.b", "set_temperature", job("second"))
+    )
+    third = hass.async_create_task(
+        queue.async_run("climate.b", "set_temperature", job("third"))
+    )
+    await asyncio.sleep(0)
+    release.set()
+
+    assert await first is True
+    assert await second is False
+    assert await third is True
+    assert ran == ["first", "third"]
+    assert queue.as_dict()["superseded"] == 1
+
+
+async def test_errors_reach_the_caller(hass: HomeAssistant) -> None:
+    """Test a failing command raises for its caller and the queue carries on."""
+    queue = async_get_command_queue(hass, "ir")
+    ran: list[str] = []
+
+    async def failing() -> None:
+        raise RuntimeError("gateway offline")
+
+    async def working() -> None:
+        ran.append("working")
+
+    failed = hass.async_create_task(
+        queue.async_run("climate.a", "set_hvac_mode", failing)
+    )
+    assert await queue.async_run("climate.b", "set_hvac_mode", working) is True
+    with pytest.raises(RuntimeError, match="gateway offline"):
+        await failed
+    assert ran == ["working"]
+
+
+async def test_nested_command_runs_directly(hass: HomeAssistant) -> None:
+    """Test a command that waits on a command of its own group does not deadlock."""
+    queue = async_get_command_queue(hass, "ir")
+    context = Context()
+    ran: list[str] = []
+
+    async def inner() -> None:
+        ran.append("inner")
+
+    async def outer() -> None:
+        assert await queue.async_run("climate.b", "set_hvac_mode", inner, context)
+        ran.append("outer")
+
+    async with asyncio.timeout(1):
+        assert await queue.async_run("climate.a", "set_hvac_mode", outer, context)
+    assert ran == ["inner", "outer"]
+
+
+async def test_command_spawned_by_running_command_queues(hass: HomeAssistant) -> None:
+    """Test a task started by the running command waits for it to finish."""
+    queue = async_get_command_queue(hass, "ir")
+    ran: list[str] = []
+    spawned: list[asyncio.Task] = []
+
+    async def listener() -> None:
+        await queue.async_run("climate.b", "set_hvac_mode", inner, Context())
+
+    async def inner() -> None:
+        ran.append("b_sent")
+
+    async def outer() -> None:
+        # e.g. an automation triggered by an event the script fired
+        spawned.append(hass.async_create_task(listener()))
+        await asyncio.sleep(0.05)
+        ran.append("a_done")
+
+    async with asyncio.timeout(1):
+        await queue.async_run("climate.a", "set_hvac_mode", outer, Context())
+        await spawned[0]
+    assert ran == ["a_done", "b_sent"]
+
+
+async def test_same_context_from_another_task_queues(hass: HomeAssistant) -> None:
+    """Test climates set by one service call still take turns."""
+    queue = async_get_command_queue(hass, "ir")
+    context = Context()
+    ran: list[str] = []
+
+    def job(name: str):
+        async def _job() -> None:
+            ran.append(f"{name}_start")
+            await asyncio.sleep(0.05)
+            ran.append(f"{name}_done")
+
+        return _job
+
+    async with asyncio.timeout(1):
+        first = hass.async_create_task(
+            queue.async_run("climate.a", "set_hvac_mode", job("a"), context)
+        )
+        while not ran:
+            await asyncio.sleep(0)
+        await queue.async_run("climate.b", "set_hvac_mode", job("b"), context)
+        await first
+    assert ran == ["a_start", "a_done", "b_start", "b_done"]
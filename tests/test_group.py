@@ -0,0 +1,156 @@
+"""Tests for zone groups."""
+
+import asyncio
+
+from homeassistant.components.climate.const import HVACAction
+from homeassistant.const import STATE_UNAVAILABLE
+from homeassistant.core import HomeAssistant
+from homeassistant.setup import async_setup_component
+from pytest_homeassistant_custom_component.common import async_mock_service
+
+from custom_components.climate_template.group import ZoneAggregator
+
+ZONES = ["climate.a", "climate.b", "climate.c"]
+
+
+def _set_zone(
+    hass: HomeAssistant,
+    entity_id: str,
+    mode: str,
+    temperature: float | str | None = None,
+    action: str | None = None,
+) -> None:
+    """Set the state of a zone."""
+    hass.states.async_set(
+        entity_id,
+        mode,
+        {"current_temperature": temperature, "hvac_action": action},
+    )
+
+
+async def _updated(hass: HomeAssistant) -> None:
+    """Wait for zone changes to reach the aggregator's update."""
+    await hass.async_block_till_done()
+    # the coalesced update runs on the next iteration of the event loop
+    await asyncio.sleep(0)
+
+
+async def _started(hass: HomeAssistant) -> tuple[ZoneAggregator, list[None]]:
+    """Return a started aggregator of the zones and the list of its updates."""
+    updates: list[None] = []
+    aggregator = ZoneAggregator(hass, ZONES, lambda: updates.append(None))
+    aggregator.async_start()
+    await _updated(hass)
+    return aggregator, updates
+
+
+async def test_aggregates_zone_states(hass: HomeAssistant) -> None:
+    """Test the mean temperature, majority mode and most significant action."""
+    _set_zone(hass, "climate.a", "heat", 20, HVACAction.HEATING)
+    _set_zone(hass, "climate.b", "heat", "22", HVACAction.IDLE)
+    _set_zone(hass, "climate.c", "cool", "n/a", HVACAction.COOLING)
+
+    aggregator, updates = await _started(hass)
+
+    assert len(updates) == 1
+    assert aggregator.current_temperature == 21
+    assert aggregator.hvac_mode == "heat"
+    assert aggregator.hvac_action == HVACAction.HEATING
+    assert aggregator.hvac_actions == ["cooling", "heating", "idle"]
+
+
+async def test_updates_incrementally(hass: HomeAssistant) -> None:
+    """Test zone changes replace their previous contribution."""
+    _set_zone(hass, "climate.a", "heat", 20, HVACAction.HEATING)
+    _set_zone(hass, "climate.b", "heat", 22, HVACAction.IDLE)
+    _set_zone(hass, "climate.c", "cool", 24, HVACAction.COOLING)
+    aggregator, updates = await _started(hass)
+
+    # changes that arrive together give a single update
+    _set_zone(hass, "climate.a", "cool", 21, HVACAction.IDLE)
+    hass.states.async_set("climate.b", STATE_UNAVAILABLE)
+    await _updated(hass)
+
+    assert len(updates) == 2
+    assert aggregator.current_temperature == 22.5
+    assert aggregator.hvac_mode == "cool"
+    assert aggregator.hvac_action == HVACAction.COOLING
+    assert aggregator.hvac_actions == ["cooling", "idle"]
+
+    hass.states.async_remove("climate.a")
+    hass.states.async_remove("climate.c")
+    await _updated(hass)
+
+    assert aggregator.current_temperature is None
+    assert aggregator.hvac_mode is None
+    assert aggregator.hvac_action is None
+    assert aggregator.hvac_actions == []
+    assert len(updates) == 3
+
+
+async def test_affected_zones(hass: HomeAssistant) -> None:
+    """Test only zones a command would change are affected."""
+    _set_zone(hass, "climate.a", "heat")
+    hass.states.async_set("climate.b", "cool", {"fan_mode": "low"})
+    hass.states.async_set("climate.c", STATE_UNAVAILABLE)
+    aggregator = ZoneAggregator(hass, ZONES, lambda: None)
+
+    assert aggregator.async_affected_zones(
+        {"hvac_mode": "heat", "temperature": None}
+    ) == ["climate.b", "climate.c"]
+    assert aggregator.async_affected_zones({"fan_mode": "low"}) == [
+        "climate.a",
+        "climate.c",
+    ]
+
+
+async def test_zones_take_on_group_command(
+    hass: HomeAssistant, enable_custom_integrations: None
+) -> None:
+    """Test zones take on the values a group command sent them."""
+    group_calls = async_mock_service(hass, "test", "group")
+    zone_calls = async_mock_service(hass, "test", "zone")
+    hass.states.async_set("input_select.mode", "heat")
+    zone_action = [{"service": "test.zone"}]
+    assert await async_setup_component(
+        hass,
+        "climate",
+        {
+            "climate": [
+                {
+                    "platform": "climate_template",
+                    "name": "group",
+                    "zones": ["climate.a", "climate.b"],
+                    "set_hvac_mode": [
+                        {"service": "test.group", "data": {"zones": "{{ zones }}"}}
+                    ],
+                },
+                {
+                    "platform": "climate_template",
+                    "name": "a",
+                    "set_hvac_mode": zone_action,
+                },
+                {
+                    "platform": "climate_template",
+                    "name": "b",
+                    "hvac_mode_template": "{{ states('input_select.mode') }}",
+                    "set_hvac_mode": zone_action,
+                },
+            ]
+        },
+    )
+    await hass.async_block_till_done()
+
+    await hass.services.async_call(
+        "climate",
+        "set_hvac_mode",
+        {"entity_id": "climate.group", "hvac_mode": "cool"},
+        blocking=True,
+    )
+    await hass.async_block_till_done()
+
+    assert [call.data["zones"] for call in group_calls] == [["climate.a", "climate.b"]]
+    assert zone_calls == []
+    assert hass.states.get("climate.a").state == "cool"
+    # values a zone gets from a template are left alone
+    assert hass.states.get("climate.b").state == "heat"
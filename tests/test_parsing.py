@@ -0,0 +1,128 @@
+"""Tests for the parse error accounting."""
+
+from datetime import timedelta
+import logging
+
+from freezegun.api import FrozenDateTimeFactory
+import pytest
+
+from homeassistant.const import EVENT_STATE_CHANGED
+from homeassistant.core import HomeAssistant
+from homeassistant.setup import async_setup_component
+from pytest_homeassistant_custom_component.common import (
+    async_capture_events,
+    async_fire_time_changed,
+)
+
+from custom_components.climate_template.climate import ATTR_PARSE_ERRORS
+from custom_components.climate_template.parsing import (
+    PARSE_ERROR_LOG_INTERVAL,
+    ParseErrors,
+    is_unparsed,
+)
+
+INTERVAL = timedelta(seconds=PARSE_ERROR_LOG_INTERVAL)
+
+
+def test_is_unparsed() -> None:
+    """Test unknown and unavailable results are recognized, whatever their type."""
+    assert is_unparsed("unknown")
+    assert is_unparsed("unavailable")
+    assert not is_unparsed("heat")
+    assert not is_unparsed(None)
+    assert not is_unparsed(["unknown"])
+    assert not is_unparsed({"state": "unknown"})
+
+
+async def test_suppressed_errors_reported_after_interval(
+    hass: HomeAssistant,
+    freezer: FrozenDateTimeFactory,
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    """Test errors suppressed in an interval are logged when it ends."""
+    caplog.set_level(logging.ERROR)
+    reports: list[dict[str, int]] = []
+    errors = ParseErrors(hass, "climate.test", lambda: reports.append(errors.as_dict()))
+
+    errors.record("hvac_mode", "Received invalid hvac mode: %s", "a")
+    errors.record("hvac_mode", "Received invalid hvac mode: %s", "b")
+    errors.record("hvac_mode", "Received invalid hvac mode: %s", "c")
+    assert caplog.messages == ["climate.test: Received invalid hvac mode: a"]
+    assert reports == [{"hvac_mode": 1}]
+
+    freezer.tick(INTERVAL)
+    async_fire_time_changed(hass)
+    await hass.async_block_till_done()
+
+    assert caplog.messages[1:] == [
+        "climate.test: Received invalid hvac mode: c"
+        " (2 similar errors since the last report)"
+    ]
+    assert reports == [{"hvac_mode": 1}, {"hvac_mode": 3}]
+
+    # nothing was suppressed since the report, so nothing more is logged
+    freezer.tick(INTERVAL)
+    async_fire_time_changed(hass)
+    await hass.async_block_till_done()
+    assert len(caplog.messages) == 2
+    assert len(reports) == 2
+
+
+async def test_cancel_drops_pending_report(
+    hass: HomeAssistant,
+    freezer: FrozenDateTimeFactory,
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    """Test no report is logged once the pending reports are cancelled."""
+    caplog.set_level(logging.ERROR)
+    errors = ParseErrors(hass, "climate.test", lambda: None)
+    errors.record("fan_mode", "Received invalid fan mode: %s", "a")
+    errors.record("fan_mode", "Received invalid fan mode: %s", "b")
+
+    errors.async_cancel()
+    freezer.tick(INTERVAL)
+    async_fire_time_changed(hass)
+    await hass.async_block_till_done()
+
+    assert len(caplog.messages) == 1
+
+
+async def test_bad_renders_do_not_change_the_state(
+    hass: HomeAssistant,
+    enable_custom_integrations: None,
+    freezer: FrozenDateTimeFactory,
+) -> None:
+    """Test suppressed errors publish their count only with the report."""
+    hass.states.async_set("sensor.temperature", "21")
+    assert await async_setup_component(
+        hass,
+        "climate",
+        {
+            "climate": {
+                "platform": "climate_template",
+                "name": "test",
+                "current_temperature_template": "{{ states('sensor.temperature') }}",
+            }
+        },
+    )
+    await hass.async_block_till_done()
+    changes = async_capture_events(hass, EVENT_STATE_CHANGED)
+
+    for value in ("n/a", "n/b", "n/c", "n/d"):
+        hass.states.async_set("sensor.temperature", value)
+        await hass.async_block_till_done()
+
+    climate_changes = [
+        event for event in changes if event.data["entity_id"] == "climate.test"
+    ]
+    assert len(climate_changes) == 1
+    assert climate_changes[0].data["new_state"].attributes[ATTR_PARSE_ERRORS] == {
+        "current_temperature": 1
+    }
+
+    freezer.tick(INTERVAL)
+    async_fire_time_changed(hass)
+    await hass.async_block_till_done()
+
+    state = hass.states.get("climate.test")
+    assert state.attributes[ATTR_PARSE_ERRORS] == {"current_temperature": 4}
@@ -0,0 +1,149 @@
+"""Tests for the persisted template results."""
+
+from datetime import timedelta
+from typing import Any
+from unittest.mock import patch
+
+from freezegun.api import FrozenDateTimeFactory
+
+from homeassistant.const import EVENT_HOMEASSISTANT_STARTED
+from homeassistant.core import CoreState, HomeAssistant
+from homeassistant.setup import async_setup_component
+from homeassistant.util import dt as dt_util
+from pytest_homeassistant_custom_component.common import async_fire_time_changed
+
+from custom_components.climate_template.climate import DOMAIN
+from custom_components.climate_template.store import (
+    SAVE_DELAY,
+    STORAGE_KEY,
+    STORAGE_VERSION,
+)
+
+WARM_UP = timedelta(seconds=60)
+
+CONFIG = {
+    "climate": {
+        "platform": DOMAIN,
+        "name": "a",
+        "unique_id": "a",
+        "hvac_action_template": "{{ states('sensor.hvac_action') }}",
+        "fan_mode_template": "{{ states('input_select.fan_mode') }}",
+        "fan_modes": ["low", "high"],
+        "set_fan_mode": [{"service": "test.send"}],
+        "persist_template_results": True,
+        "warm_up": {"seconds": WARM_UP.total_seconds()},
+    }
+}
+
+
+def _stored(hass_storage: dict[str, Any], results: dict[str, dict]) -> None:
+    """Store template results as a previous run would have."""
+    hass_storage[STORAGE_KEY] = {
+        "version": STORAGE_VERSION,
+        "minor_version": 1,
+        "key": STORAGE_KEY,
+        "data": results,
+    }
+
+
+async def _warm_up(hass: HomeAssistant) -> None:
+    """Let the warm-up window pass."""
+    async_fire_time_changed(hass, dt_util.utcnow() + WARM_UP)
+    await hass.async_block_till_done()
+
+
+async def _save(
+    hass: HomeAssistant, freezer: FrozenDateTimeFactory, hass_storage: dict[str, Any]
+) -> dict:
+    """Return the results once the store has been saved."""
+    freezer.tick(SAVE_DELAY)
+    async_fire_time_changed(hass)
+    await hass.async_block_till_done()
+    return hass_storage[STORAGE_KEY]["data"]
+
+
+async def test_results_restored_until_templates_render(
+    hass: HomeAssistant,
+    enable_custom_integrations: None,
+    freezer: FrozenDateTimeFactory,
+    hass_storage: dict[str, Any],
+) -> None:
+    """Test stored results are used until the warm-up renders the templates."""
+    _stored(
+        hass_storage,
+        {"a": {"_attr_hvac_action": "heating", "_attr_fan_mode": "medium"}},
+    )
+    hass.states.async_set("sensor.hvac_action", "idle")
+    hass.states.async_set("input_select.fan_mode", "high")
+    assert await async_setup_component(hass, "climate", CONFIG)
+    await hass.async_block_till_done()
+
+    state = hass.states.get("climate.a")
+    assert state.attributes["hvac_action"] == "heating"
+    # fan modes that are no longer configured are not restored
+    assert state.attributes["fan_mode"] == "low"
+
+    await _warm_up(hass)
+    state = hass.states.get("climate.a")
+    assert state.attributes["hvac_action"] == "idle"
+    assert state.attributes["fan_mode"] == "high"
+
+    assert (await _save(hass, freezer, hass_storage))["a"] == {
+        "_attr_hvac_action": "idle",
+        "_attr_fan_mode": "high",
+    }
+
+
+async def test_results_kept_on_reload(
+    hass: HomeAssistant,
+    enable_custom_integrations: None,
+    freezer: FrozenDateTimeFactory,
+    hass_storage: dict[str, Any],
+) -> None:
+    """Test a reload restores the results instead of forgetting them."""
+    hass.states.async_set("sensor.hvac_action", "heating")
+    hass.states.async_set("input_select.fan_mode", "high")
+    assert await async_setup_component(hass, "climate", CONFIG)
+    await hass.async_block_till_done()
+    await _warm_up(hass)
+    assert hass.states.get("climate.a").attributes["hvac_action"] == "heating"
+
+    with patch("homeassistant.config.load_yaml_config_file", return_value=CONFIG):
+        await hass.services.async_call(DOMAIN, "reload", blocking=True)
+        await hass.async_block_till_done()
+
+    # the templates have not rendered again yet, the stored results are used
+    state = hass.states.get("climate.a")
+    assert state.attributes["hvac_action"] == "heating"
+    assert state.attributes["fan_mode"] == "high"
+    assert (await _save(hass, freezer, hass_storage))["a"] == {
+        "_attr_hvac_action": "heating",
+        "_attr_fan_mode": "high",
+    }
+
+
+async def test_unclaimed_results_pruned_after_startup(
+    hass: HomeAssistant,
+    enable_custom_integrations: None,
+    freezer: FrozenDateTimeFactory,
+    hass_storage: dict[str, Any],
+) -> None:
+    """Test results of climates that were not set up are removed on startup."""
+    _stored(
+        hass_storage,
+        {
+            "a": {"_attr_hvac_action": "heating"},
+            "removed": {"_attr_hvac_action": "cooling"},
+        },
+    )
+    hass.set_state(CoreState.not_running)
+    assert await async_setup_component(hass, "climate", CONFIG)
+    await hass.async_block_till_done()
+
+    hass.set_state(CoreState.running)
+    hass.bus.async_fire(EVENT_HOMEASSISTANT_STARTED)
+    await hass.async_block_till_done()
+
+    assert (await _save(hass, freezer, hass_storage)) == {
+        "a": {"_attr_hvac_action": "heating"}
+    }
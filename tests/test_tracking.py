@@ -0,0 +1,130 @@
+"""Tests for the command round-trip tracker."""
+
+from datetime import timedelta
+import logging
+
+import pytest
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.entity import Entity
+from homeassistant.util import dt as dt_util
+from pytest_homeassistant_custom_component.common import (
+    async_capture_events,
+    async_fire_time_changed,
+)
+
+from custom_components.climate_template.tracking import (
+    EVENT_COMMAND_CONFIRMED,
+    EVENT_COMMAND_TIMEOUT,
+    CommandTracker,
+)
+
+TIMEOUT = timedelta(seconds=5)
+
+
+def _tracker(
+    hass: HomeAssistant, retries: int = 0, tolerance: float = 0.0
+) -> tuple[CommandTracker, list[None]]:
+    """Return a tracker for a test entity and the list its timeouts go to."""
+    entity = Entity()
+    entity.hass = hass
+    entity.entity_id = "climate.test"
+    timeouts: list[None] = []
+    tracker = CommandTracker(
+        entity, TIMEOUT, retries, lambda: timeouts.append(None), tolerance
+    )
+    return tracker, timeouts
+
+
+async def _expire(hass: HomeAssistant, times: int = 1) -> None:
+    """Let the confirmation timeout pass a number of times."""
+    for _ in range(times):
+        async_fire_time_changed(hass, dt_util.utcnow() + TIMEOUT)
+        await hass.async_block_till_done()
+
+
+async def _resend() -> None:
+    """Resend nothing."""
+
+
+async def test_numbers_match_within_tolerance(hass: HomeAssistant) -> None:
+    """Test rounded setpoints confirm a command, other values must be equal."""
+    tracker, _ = _tracker(hass, tolerance=0.25)
+    confirmed = async_capture_events(hass, EVENT_COMMAND_CONFIRMED)
+
+    tracker.async_track(
+        "set_temperature", {"temperature": 21.3, "hvac_mode": "heat"}, _resend
+    )
+    assert not tracker.async_confirm("temperature", 22)
+    assert not tracker.async_confirm("hvac_mode", "HEAT")
+    assert not tracker.async_confirm("temperature", 21.5)
+    assert tracker.async_confirm("hvac_mode", "heat")
+    await hass.async_block_till_done()
+
+    assert [event.data["attempt"] for event in confirmed] == [1]
+    assert tracker.as_dict()["set_temperature"]["count"] == 1
+
+    # the confirmed command is no longer pending
+    assert not tracker.async_confirm("hvac_mode", "heat")
+
+
+async def test_unconfirmed_command_is_resent(hass: HomeAssistant) -> None:
+    """Test a command is resent until it runs out of retries."""
+    tracker, timeouts = _tracker(hass, retries=1)
+    timed_out = async_capture_events(hass, EVENT_COMMAND_TIMEOUT)
+    resent: list[None] = []
+
+    async def resend() -> None:
+        resent.append(None)
+
+    tracker.async_track("set_hvac_mode", {"hvac_mode": "cool"}, resend)
+    await _expire(hass, 2)
+
+    assert len(resent) == 1
+    assert [(event.data["attempt"], event.data["retrying"]) for event in timed_out] == [
+        (1, True),
+        (2, False),
+    ]
+    assert len(timeouts) == 2
+    assert tracker.as_dict()["set_hvac_mode"]["timeouts"] == 2
+    assert not tracker.async_confirm("hvac_mode", "cool")
+
+
+async def test_resent_command_confirms_its_attempt(hass: HomeAssistant) -> None:
+    """Test the confirmation of a resent command reports its attempt."""
+    tracker, _ = _tracker(hass, retries=2)
+    confirmed = async_capture_events(hass, EVENT_COMMAND_CONFIRMED)
+
+    tracker.async_track("set_fan_mode", {"fan_mode": "high"}, _resend)
+    await _expire(hass)
+    assert tracker.async_confirm("fan_mode", "high")
+    await hass.async_block_till_done()
+
+    assert [event.data["attempt"] for event in confirmed] == [2]
+
+
+async def test_failed_resend_ends_the_command(
+    hass: HomeAssistant, caplog: pytest.LogCaptureFixture
+) -> None:
+    """Test a resend that raises reports a final timeout."""
+    caplog.set_level(logging.ERROR)
+    tracker, timeouts = _tracker(hass, retries=3)
+    timed_out = async_capture_events(hass, EVENT_COMMAND_TIMEOUT)
+
+    async def resend() -> None:
+        raise RuntimeError("gateway offline")
+
+    tracker.async_track("set_hvac_mode", {"hvac_mode": "cool"}, resend)
+    await _expire(hass)
+
+    assert "gateway offline" in caplog.text
+    assert [(event.data["attempt"], event.data["retrying"]) for event in timed_out] == [
+        (1, True),
+        (2, False),
+    ]
+    assert len(timeouts) == 2
+
+    # the command is no longer pending, so no more retries are scheduled
+    await _expire(hass)
+    assert len(timed_out) == 2
+    assert not tracker.async_confirm("hvac_mode", "cool")